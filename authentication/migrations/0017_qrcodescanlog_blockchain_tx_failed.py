@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0016_doctorprofile_hospital_phone'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qrcodescanlog',
+            name='blockchain_tx_failed',
+            field=models.BooleanField(default=False, help_text='Whether the blockchain transaction failed'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0017_qrcodescanlog_blockchain_tx_failed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='qrcodescanlog',
+            index=models.Index(condition=models.Q(('blockchain_block_number__isnull', True), ('blockchain_tx_failed', False)), fields=['blockchain_tx_hash'], name='idx_pending_tx'),
+        ),
+    ]
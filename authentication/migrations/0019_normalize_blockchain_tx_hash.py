@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:40
+
+from django.db import migrations
+from django.db.models import Count, Value
+from django.db.models.functions import Concat, Lower
+
+
+def normalize_tx_hashes(apps, schema_editor):
+    """Rewrite stored transaction hashes to lowercase with a 0x prefix"""
+    QRCodeScanLog = apps.get_model('authentication', 'QRCodeScanLog')
+    scans = QRCodeScanLog.objects.filter(blockchain_tx_hash__isnull=False)
+
+    scans.filter(blockchain_tx_hash='').update(blockchain_tx_hash=None)
+    scans.filter(blockchain_tx_hash__istartswith='0x').update(
+        blockchain_tx_hash=Lower('blockchain_tx_hash')
+    )
+    scans.exclude(blockchain_tx_hash__istartswith='0x').update(
+        blockchain_tx_hash=Concat(Value('0x'), Lower('blockchain_tx_hash'))
+    )
+
+    # Hashes stored in different forms can now be identical. Keep the hash
+    # on the earliest scan and clear it from the rest, so the unique
+    # constraint in the next migration can be built
+    duplicate_hashes = (
+        QRCodeScanLog.objects.filter(blockchain_tx_hash__isnull=False)
+        .values('blockchain_tx_hash')
+        .annotate(scan_count=Count('id'))
+        .filter(scan_count__gt=1)
+        .values_list('blockchain_tx_hash', flat=True)
+    )
+    for tx_hash in duplicate_hashes:
+        duplicates = QRCodeScanLog.objects.filter(blockchain_tx_hash=tx_hash).order_by('scan_timestamp', 'id')
+        keep_id = duplicates.values_list('id', flat=True)[0]
+        duplicates.exclude(id=keep_id).update(blockchain_tx_hash=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0018_qrcodescanlog_idx_pending_tx'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_tx_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0019_normalize_blockchain_tx_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='qrcodescanlog',
+            name='blockchain_tx_hash',
+            field=models.CharField(blank=True, help_text='Ethereum transaction hash (lowercase, 0x-prefixed)', max_length=66, null=True, unique=True),
+        ),
+    ]
@@ -122,20 +122,31 @@ class QRCodeScanLog(models.Model):
     denial_reason = models.CharField(max_length=255, blank=True, null=True)
     
     # Blockchain verification fields
-    blockchain_tx_hash = models.CharField(max_length=66, blank=True, null=True, 
-                                          help_text='Ethereum transaction hash')
+    blockchain_tx_hash = models.CharField(max_length=66, blank=True, null=True, unique=True,
+                                          help_text='Ethereum transaction hash (lowercase, 0x-prefixed)')
     blockchain_log_id = models.BigIntegerField(blank=True, null=True,
                                                 help_text='Smart contract log ID')
     blockchain_block_number = models.BigIntegerField(blank=True, null=True,
                                                       help_text='Block number on blockchain')
     blockchain_verified = models.BooleanField(default=False,
                                                help_text='Whether logged on blockchain')
+    blockchain_tx_failed = models.BooleanField(default=False,
+                                                help_text='Whether the blockchain transaction failed')
     
     class Meta:
         db_table = 'qr_code_scan_logs'
         ordering = ['-scan_timestamp']
         verbose_name = 'QR Code Scan Log'
         verbose_name_plural = 'QR Code Scan Logs'
+        indexes = [
+            # Partial index covering only scans still waiting for their
+            # blockchain transaction (the status updater's pending query)
+            models.Index(
+                fields=['blockchain_tx_hash'],
+                name='idx_pending_tx',
+                condition=models.Q(blockchain_block_number__isnull=True, blockchain_tx_failed=False),
+            ),
+        ]
     
     def __str__(self):
         return f"Scan by Dr. {self.scanned_by.username if self.scanned_by else 'Unknown'} - {self.scan_timestamp}"
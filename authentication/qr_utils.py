@@ -6,8 +6,10 @@ import qrcode
 import secrets
 import hashlib
 import logging
+from functools import partial
 from io import BytesIO
 from django.core.files.base import ContentFile
+from django.db import connection
 from django.utils import timezone
 from datetime import timedelta
 from .models import PatientQRCode, QRCodeScanLog
@@ -179,46 +181,25 @@ def log_qr_scan(qr_code, doctor, ip_address=None, user_agent=None, access_grante
         try:
             from django.conf import settings
             if getattr(settings, 'BLOCKCHAIN_ENABLED', False):
-                from blockchain.blockchain_service import get_blockchain_service
+                from blockchain.blockchain_service import submit_background
                 
-                blockchain_service = get_blockchain_service()
-                if blockchain_service.is_connected():
-                    # Prepare metadata
-                    metadata = {
-                        'scan_type': 'qr_code',
-                        'access_granted': access_granted,
-                        'timestamp': str(timezone.now())
-                    }
-                    
-                    # Log to blockchain
-                    result = blockchain_service.log_qr_scan(
-                        doctor_id=doctor.id,
-                        patient_id=qr_code.patient.id,
-                        access_granted=access_granted,
-                        metadata=metadata
-                    )
-                    
-                    if result and result.get('success'):
-                        # Save transaction hash immediately (even if pending)
-                        scan_log.blockchain_tx_hash = result.get('transaction_hash')
-                        
-                        # Mark as verified if we have tx hash
-                        if result.get('transaction_hash'):
-                            scan_log.blockchain_verified = True
-                        
-                        # Add confirmed data if available
-                        if not result.get('pending'):
-                            scan_log.blockchain_log_id = result.get('log_id')
-                            scan_log.blockchain_block_number = result.get('block_number')
-                        
-                        scan_log.save()
-                        
-                        status = "pending" if result.get('pending') else "confirmed"
-                        logger.info(f"✓ Scan logged to blockchain ({status}): {result.get('transaction_hash')}")
-                    else:
-                        logger.warning(f"Failed to log to blockchain: {result.get('error') if result else 'Unknown error'}")
-                else:
-                    logger.warning("Blockchain service not connected")
+                # Prepare metadata
+                metadata = {
+                    'scan_type': 'qr_code',
+                    'access_granted': access_granted,
+                    'timestamp': str(timezone.now())
+                }
+                
+                # Send the transaction from the per-process blockchain worker
+                # pool so the scan response doesn't wait on RPC round trips
+                submit_background(
+                    _log_scan_to_blockchain,
+                    scan_log.id,
+                    doctor.id,
+                    qr_code.patient.id,
+                    access_granted,
+                    metadata
+                )
         except Exception as blockchain_error:
             # Don't fail the scan if blockchain logging fails
             logger.error(f"Blockchain logging error: {str(blockchain_error)}")
@@ -230,6 +211,71 @@ def log_qr_scan(qr_code, doctor, ip_address=None, user_agent=None, access_grante
         return None
 
 
+def _log_scan_to_blockchain(scan_log_id, doctor_id, patient_id, access_granted, metadata):
+    """
+    Log a QR scan to the blockchain and save the transaction hash
+    (runs on the blockchain worker pool)
+    """
+    try:
+        from blockchain.blockchain_service import get_blockchain_service
+        
+        blockchain_service = get_blockchain_service()
+        if not blockchain_service.is_connected():
+            logger.warning("Blockchain service not connected")
+            return
+        
+        # Log to blockchain
+        result = blockchain_service.log_qr_scan(
+            doctor_id=doctor_id,
+            patient_id=patient_id,
+            access_granted=access_granted,
+            metadata=metadata,
+            on_confirmed=partial(_record_scan_confirmation, scan_log_id)
+        )
+        
+        if result and result.get('success'):
+            # Save transaction hash immediately (even if pending). Only the tx
+            # fields are written - block details are filled in by the
+            # background confirmation and must not be overwritten
+            QRCodeScanLog.objects.filter(id=scan_log_id).update(
+                blockchain_tx_hash=result.get('transaction_hash'),
+                blockchain_verified=bool(result.get('transaction_hash')),
+            )
+            
+            status = "pending" if result.get('pending') else "confirmed"
+            logger.info(f"✓ Scan logged to blockchain ({status}): {result.get('transaction_hash')}")
+        else:
+            logger.warning(f"Failed to log to blockchain: {result.get('error') if result else 'Unknown error'}")
+    except Exception as blockchain_error:
+        logger.error(f"Blockchain logging error: {str(blockchain_error)}")
+    finally:
+        # Worker threads get their own DB connection; don't leak it
+        connection.close()
+
+
+def _record_scan_confirmation(scan_log_id, confirmation):
+    """
+    Store block details for a scan once its blockchain transaction is mined
+    (runs on the blockchain service's confirmation thread)
+    """
+    try:
+        if confirmation['status'] != 1:
+            logger.warning(f"✗ Transaction {confirmation['transaction_hash']} failed (status: {confirmation['status']})")
+            QRCodeScanLog.objects.filter(id=scan_log_id).update(blockchain_tx_failed=True)
+            return
+        
+        QRCodeScanLog.objects.filter(id=scan_log_id).update(
+            blockchain_block_number=confirmation['block_number'],
+            blockchain_log_id=confirmation['log_id'],
+            blockchain_verified=True,
+        )
+    except Exception as e:
+        logger.error(f"Error recording blockchain confirmation for scan {scan_log_id}: {str(e)}")
+    finally:
+        # Background threads get their own DB connection; don't leak it
+        connection.close()
+
+
 def regenerate_patient_qr_code(patient):
     """
     Regenerate patient's QR code (creates new token, invalidates old one)
@@ -21,7 +21,7 @@ from .qr_utils import (
     enable_patient_qr_code,
     generate_qr_code
 )
-from blockchain.status_updater import update_single_transaction
+from blockchain.status_updater import normalize_tx_hash, update_single_transaction
 import json
 import os
 
@@ -491,7 +491,7 @@ def refresh_blockchain_status(request):
         if result['success']:
             # Get updated scan data
             scan = QRCodeScanLog.objects.filter(
-                blockchain_tx_hash__in=[tx_hash, tx_hash.lstrip('0x')]
+                blockchain_tx_hash=normalize_tx_hash(tx_hash)
             ).first()
             
             if scan:
@@ -16,6 +16,7 @@ from datetime import datetime
 from django.conf import settings
 
 from utils.geocoding import get_lat_lng_from_address
+from utils.keyword_regex import compile_keyword_union
 
 
 def home(request):
@@ -713,6 +714,67 @@ def process_ocr(record_id):
             pass
 
 
+# Common medical test parameter keywords
+MEDICAL_TEST_NAMES = [
+    'glucose', 'hemoglobin', 'hba1c', 'hgb', 'hct', 'hematocrit',
+    'cholesterol', 'ldl', 'hdl', 'vldl', 'triglyceride', 'lipid',
+    'creatinine', 'urea', 'bun', 'egfr', 'gfr',
+    'sodium', 'potassium', 'chloride', 'bicarbonate', 'calcium', 'magnesium', 'phosphorus',
+    'albumin', 'globulin', 'protein', 'bilirubin', 'direct', 'indirect', 'total',
+    'sgpt', 'sgot', 'alt', 'ast', 'alp', 'alkaline', 'ggt', 'ldh',
+    'amylase', 'lipase', 'cpk', 'troponin', 'bnp', 'nt-pro',
+    'wbc', 'rbc', 'platelet', 'neutrophil', 'lymphocyte', 'monocyte', 'eosinophil', 'basophil',
+    'esr', 'crp', 'tsh', 't3', 't4', 'ft3', 'ft4', 'cortisol',
+    'vitamin', 'b12', 'folate', 'iron', 'ferritin', 'tibc', 'transferrin',
+    'uric', 'acid', 'psa', 'cea', 'ca-125', 'ca-19', 'afp',
+    'inr', 'pt', 'ptt', 'aptt', 'fibrinogen', 'd-dimer',
+    'hbsag', 'anti-hcv', 'hiv', 'vdrl', 'tpha',
+    'mcv', 'mch', 'mchc', 'rdw', 'mpv', 'pdw',
+    'fasting', 'postprandial', 'random', 'a1c'
+]
+
+# Words that indicate this is NOT a test result
+EXCLUDE_KEYWORDS = [
+    'email', 'phone', 'tel', 'fax', 'website', 'www', 'http', '@',
+    'address', 'street', 'city', 'zip', 'postal',
+    'report date', 'collection date', 'receipt date', 'sampling date',
+    'patient id', 'patient name', 'your id', 'request code',
+    'date of birth', 'age', 'gender', 'physician', 'doctor',
+    'page', 'printed', 'generated', 'laboratory', 'hospital',
+    'borderline:', 'very high:', 'very low:', 'optimal:', 'normal:',
+    'reference range', 'reference value', 'reference interval'
+]
+
+# Single prefix-trie alternations so each line is scanned once by the regex
+# engine instead of once per keyword
+_MEDICAL_TEST_RE = compile_keyword_union(MEDICAL_TEST_NAMES)
+_EXCLUDE_RE = compile_keyword_union(EXCLUDE_KEYWORDS)
+
+# Keys that label a reference range rather than a measured value
+_REFERENCE_RANGE_KEYS = frozenset(['normal', 'optimal', 'borderline', 'high', 'low', 'very high', 'very low'])
+
+# Unit fragments that mark a value as a measurement
+_UNIT_MARKERS = ('mg', 'dl', 'mmol', 'g/', 'ml', 'µl', 'ng', 'pg', 'iu', '%', 'cells', 'mm', 'fL', 'sec', 'min')
+
+# Additional patterns that indicate reference ranges, not actual results
+_REFERENCE_RANGE_RE = re.compile(
+    r'^(?:'
+    r'(normal|optimal|borderline|high|low|very high|very low)\s*:'
+    r'|(normal|optimal)\s*<'
+    r'|\s*<\s*\d+\.?\d*\s*,'  # Starts with < number,
+    r'|\s*>\s*\d+\.?\d*\s*,'  # Starts with > number,
+    r')',
+    re.IGNORECASE
+)
+
+# First characters a stripped line must start with to match any reference
+# range pattern; lines starting with anything else skip the regex entirely
+_REFERENCE_RANGE_FIRST_CHARS = frozenset('<>nobhlvNOBHLV')
+
+# Column separator for table-like rows (multiple spaces or a tab)
+_TABLE_SPLIT_RE = re.compile(r'\s{2,}|\t')
+
+
 def extract_medical_data(text):
     """Extract structured medical data from OCR text"""
     data = {}
@@ -823,117 +885,94 @@ def extract_medical_data(text):
     
     # Extract test results (improved filtering)
     test_results = {}
-    lines = text.split('\n')
-    
-    # Common medical test parameter keywords
-    medical_test_names = [
-        'glucose', 'hemoglobin', 'hba1c', 'hgb', 'hct', 'hematocrit',
-        'cholesterol', 'ldl', 'hdl', 'vldl', 'triglyceride', 'lipid',
-        'creatinine', 'urea', 'bun', 'egfr', 'gfr',
-        'sodium', 'potassium', 'chloride', 'bicarbonate', 'calcium', 'magnesium', 'phosphorus',
-        'albumin', 'globulin', 'protein', 'bilirubin', 'direct', 'indirect', 'total',
-        'sgpt', 'sgot', 'alt', 'ast', 'alp', 'alkaline', 'ggt', 'ldh',
-        'amylase', 'lipase', 'cpk', 'troponin', 'bnp', 'nt-pro',
-        'wbc', 'rbc', 'platelet', 'neutrophil', 'lymphocyte', 'monocyte', 'eosinophil', 'basophil',
-        'esr', 'crp', 'tsh', 't3', 't4', 'ft3', 'ft4', 'cortisol',
-        'vitamin', 'b12', 'folate', 'iron', 'ferritin', 'tibc', 'transferrin',
-        'uric', 'acid', 'psa', 'cea', 'ca-125', 'ca-19', 'afp',
-        'inr', 'pt', 'ptt', 'aptt', 'fibrinogen', 'd-dimer',
-        'hbsag', 'anti-hcv', 'hiv', 'vdrl', 'tpha',
-        'mcv', 'mch', 'mchc', 'rdw', 'mpv', 'pdw',
-        'fasting', 'postprandial', 'random', 'a1c'
-    ]
-    
-    # Words that indicate this is NOT a test result
-    exclude_keywords = [
-        'email', 'phone', 'tel', 'fax', 'website', 'www', 'http', '@',
-        'address', 'street', 'city', 'zip', 'postal',
-        'report date', 'collection date', 'receipt date', 'sampling date',
-        'patient id', 'patient name', 'your id', 'request code',
-        'date of birth', 'age', 'gender', 'physician', 'doctor',
-        'page', 'printed', 'generated', 'laboratory', 'hospital',
-        'borderline:', 'very high:', 'very low:', 'optimal:', 'normal:',
-        'reference range', 'reference value', 'reference interval'
-    ]
-    
-    # Additional patterns that indicate reference ranges, not actual results
-    reference_range_patterns = [
-        r'^(normal|optimal|borderline|high|low|very high|very low)\s*:',
-        r'^(normal|optimal)\s*<',
-        r'^\s*<\s*\d+\.?\d*\s*,',  # Starts with < number,
-        r'^\s*>\s*\d+\.?\d*\s*,',  # Starts with > number,
-    ]
-    
-    for line in lines:
+    # splitlines() also handles CRLF/CR line endings from OCR output
+    lines = text.splitlines()
+    # Lowercase the whole report once and split it in step with the original
+    # lines, rather than lowercasing every line in both passes below
+    lines_lower = text_lower.splitlines()
+    
+    # Bind hot lookups to locals for the line loops
+    exclude_search = _EXCLUDE_RE.search
+    medical_test_search = _MEDICAL_TEST_RE.search
+    reference_range_keys = _REFERENCE_RANGE_KEYS
+    reference_range_match = _REFERENCE_RANGE_RE.match
+    reference_range_first_chars = _REFERENCE_RANGE_FIRST_CHARS
+    unit_markers = _UNIT_MARKERS
+    table_split = _TABLE_SPLIT_RE.split
+    _any = any
+    
+    for line, line_lower in zip(lines, lines_lower):
         line = line.strip()
         if not line or len(line) < 3:
             continue
         
-        line_lower = line.lower()
+        line_lower = line_lower.strip()
         
         # Skip lines with exclude keywords
-        if any(keyword in line_lower for keyword in exclude_keywords):
+        if exclude_search(line_lower):
             continue
         
         # Skip reference range patterns
-        if any(re.match(pattern, line, re.IGNORECASE) for pattern in reference_range_patterns):
+        if line[0] in reference_range_first_chars and reference_range_match(line):
             continue
         
         # Look for test results with colon or tab separator
-        if ':' in line or '\t' in line:
-            separator = ':' if ':' in line else '\t'
-            parts = line.split(separator, 1)
+        key, separator, value = line.partition(':')
+        if not separator:
+            key, separator, value = line.partition('\t')
+        if not separator:
+            continue
+        
+        key = key.strip()
+        value = value.strip()
+        key_lower = key.lower()
+        
+        # Skip if key itself is a reference range indicator
+        if key_lower in reference_range_keys:
+            continue
+        
+        # Check if this is likely a medical test parameter
+        is_medical_test = medical_test_search(key_lower) is not None
+        
+        # Additional criteria: value contains numbers and units
+        has_numeric = _any(char.isdigit() for char in value)
+        value_lower = value.lower()
+        has_units = _any(unit in value_lower for unit in unit_markers)
+        
+        # Criteria for valid test results
+        if (key and value and 
+            2 < len(key) < 60 and 
+            len(value) < 200 and
+            has_numeric and
+            (is_medical_test or has_units) and
+            not key.isdigit()):
             
-            if len(parts) == 2:
-                key = parts[0].strip()
-                value = parts[1].strip()
-                key_lower = key.lower()
-                
-                # Skip if key itself is a reference range indicator
-                if key_lower in ['normal', 'optimal', 'borderline', 'high', 'low', 'very high', 'very low']:
-                    continue
-                
-                # Check if this is likely a medical test parameter
-                is_medical_test = any(test in key_lower for test in medical_test_names)
-                
-                # Additional criteria: value contains numbers and units
-                has_numeric = any(char.isdigit() for char in value)
-                has_units = any(unit in value.lower() for unit in ['mg', 'dl', 'mmol', 'g/', 'ml', 'µl', 'ng', 'pg', 'iu', '%', 'cells', 'mm', 'fL', 'sec', 'min'])
-                
-                # Criteria for valid test results
-                if (key and value and 
-                    2 < len(key) < 60 and 
-                    len(value) < 200 and
-                    has_numeric and
-                    (is_medical_test or has_units) and
-                    not key.isdigit()):
-                    
-                    test_results[key] = value
+            test_results[key] = value
     
     # Also try to extract table-like data (parameter | value | range format)
     # Look for lines with multiple values separated by tabs or multiple spaces
-    for line in lines:
+    for line, line_lower in zip(lines, lines_lower):
         line = line.strip()
         if not line or len(line) < 5:
             continue
             
-        line_lower = line.lower()
+        line_lower = line_lower.strip()
         
         # Skip excluded lines
-        if any(keyword in line_lower for keyword in exclude_keywords):
+        if exclude_search(line_lower):
             continue
         
         # Check if line contains medical test name
-        if any(test in line_lower for test in medical_test_names):
+        if medical_test_search(line_lower):
             # Try to parse table-like format with multiple spaces/tabs
-            parts = re.split(r'\s{2,}|\t', line)
+            parts = table_split(line)
             if len(parts) >= 2:
                 key = parts[0].strip()
                 value = ' '.join(parts[1:]).strip()
                 
                 if (key and value and 
                     2 < len(key) < 60 and 
-                    any(char.isdigit() for char in value) and
+                    _any(char.isdigit() for char in value) and
                     not key.isdigit() and
                     key not in test_results):  # Avoid duplicates
                     
@@ -5,34 +5,38 @@ Provides medical assistance through voice interaction
 
 import os
 import json
-from django.http import JsonResponse
+import hashlib
+from functools import lru_cache
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    orjson = None
 
-class VoiceAssistantService:
-    """
-    Voice Assistant Service using Groq API for fast medical assistance
-    """
-    
-    def __init__(self):
-        """Initialize the Groq client"""
-        self.api_key = os.getenv('GROQ_API_KEY')
-        self.client = None
-        
-        if self.api_key:
-            try:
-                from groq import Groq
-                self.client = Groq(api_key=self.api_key)
-            except ImportError:
-                print("Groq package not installed. Install with: pip install groq")
-            except Exception as e:
-                print(f"Error initializing Groq client: {e}")
-    
-    def get_system_prompt(self, user_type='patient', user_name='User'):
-        """Get the system prompt based on user type"""
-        base_prompt = f"""You are Dr. MedAssist, a compassionate, empathetic, and highly knowledgeable AI medical assistant. You embody the best qualities of a caring physician - warmth, understanding, patience, and expertise.
+
+def _loads(body):
+    """Parse a JSON request body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _json_response(data, status=200):
+    """Build a JSON response, serializing with orjson when available"""
+    if orjson is not None:
+        return HttpResponse(orjson.dumps(data), content_type='application/json', status=status)
+    return JsonResponse(data, status=status)
+
+
+@lru_cache(maxsize=512)
+def _build_system_prompt(user_type, user_name):
+    """Assemble the system prompt for a user; cached since it only depends on the user"""
+    base_prompt = f"""You are Dr. MedAssist, a compassionate, empathetic, and highly knowledgeable AI medical assistant. You embody the best qualities of a caring physician - warmth, understanding, patience, and expertise.
 
 You are speaking with {user_name}.
 
@@ -97,9 +101,9 @@ Remember: You're not just providing information - you're providing comfort, unde
 
 Current user type: {user_type}
 """
-        
-        if user_type == 'doctor':
-            base_prompt += """
+    
+    if user_type == 'doctor':
+        base_prompt += """
 
 👨‍⚕️ DOCTOR-SPECIFIC GUIDANCE:
 Since you're speaking with a healthcare professional:
@@ -112,8 +116,8 @@ Since you're speaking with a healthcare professional:
 - Discuss challenging cases and provide clinical reasoning support
 - Still maintain warmth - doctors need emotional support too, especially with difficult cases
 """
-        else:
-            base_prompt += """
+    else:
+        base_prompt += """
 
 👤 PATIENT-SPECIFIC GUIDANCE:
 Since you're speaking with a patient:
@@ -128,8 +132,42 @@ Since you're speaking with a patient:
 - Help them understand their treatment options and what to expect
 - Encourage healthy habits and self-care practices
 """
+    
+    return base_prompt
+
+
+class VoiceAssistantService:
+    """
+    Voice Assistant Service using Groq API for fast medical assistance
+    """
+    
+    COMPLETION_OPTIONS = {
+        'model': 'llama-3.3-70b-versatile',
+        'temperature': 0.7,
+        'max_tokens': 500,
+        'top_p': 0.9,
+    }
+    
+    # How long identical prompts reuse a previous Groq response (seconds)
+    RESPONSE_CACHE_TIMEOUT = 3600
+    
+    def __init__(self):
+        """Initialize the Groq client"""
+        self.api_key = os.getenv('GROQ_API_KEY')
+        self.client = None
         
-        return base_prompt
+        if self.api_key:
+            try:
+                from groq import Groq
+                self.client = Groq(api_key=self.api_key)
+            except ImportError:
+                print("Groq package not installed. Install with: pip install groq")
+            except Exception as e:
+                print(f"Error initializing Groq client: {e}")
+    
+    def get_system_prompt(self, user_type='patient', user_name='User'):
+        """Get the system prompt based on user type"""
+        return _build_system_prompt(user_type, user_name)
     
     def process_message(self, message: str, user_type: str = 'patient', 
                         user_name: str = 'User', conversation_history: list = None) -> dict:
@@ -146,63 +184,97 @@ Since you're speaking with a patient:
             Dictionary with response and metadata
         """
         if not self.client:
-            return {
-                'success': False,
-                'response': "I apologize, but I'm currently unavailable. Please try again later or contact support.",
-                'error': 'Groq client not initialized'
-            }
+            return self._unavailable_response()
         
         try:
-            messages = [
-                {
-                    "role": "system",
-                    "content": self.get_system_prompt(user_type, user_name)
-                }
-            ]
-            
-            # Add conversation history if provided
-            if conversation_history:
-                for hist in conversation_history[-6:]:  # Keep last 6 messages for context
-                    messages.append({
-                        "role": hist.get('role', 'user'),
-                        "content": hist.get('content', '')
-                    })
-            
-            # Add current message
-            messages.append({
-                "role": "user",
-                "content": message
-            })
+            messages = self._build_messages(message, user_type, user_name, conversation_history)
+            cache_key = self._response_cache_key(messages, user_type, user_name)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return {**cached, 'cached': True}
             
             # Call Groq API with fast model
             completion = self.client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
                 messages=messages,
-                temperature=0.7,
-                max_tokens=500,
-                top_p=0.9,
+                **self.COMPLETION_OPTIONS
             )
-            
-            response_text = completion.choices[0].message.content
-            
-            return {
-                'success': True,
-                'response': response_text,
-                'model': 'llama-3.3-70b-versatile',
-                'tokens_used': completion.usage.total_tokens if completion.usage else None
-            }
+            result = self._format_completion(completion)
+            cache.set(cache_key, result, self.RESPONSE_CACHE_TIMEOUT)
+            return result
             
         except Exception as e:
-            print(f"Error processing voice assistant message: {e}")
-            return {
-                'success': False,
-                'response': "I apologize, but I encountered an issue processing your request. Please try again.",
-                'error': str(e)
+            return self._error_response(e)
+    
+    def _build_messages(self, message, user_type, user_name, conversation_history):
+        """Build the chat messages sent to Groq"""
+        messages = [
+            {
+                "role": "system",
+                "content": self.get_system_prompt(user_type, user_name)
             }
+        ]
+        
+        # Add conversation history if provided
+        if conversation_history:
+            for hist in conversation_history[-6:]:  # Keep last 6 messages for context
+                messages.append({
+                    "role": hist.get('role', 'user'),
+                    "content": hist.get('content', '')
+                })
+        
+        # Add current message
+        messages.append({
+            "role": "user",
+            "content": message
+        })
+        return messages
+    
+    def _response_cache_key(self, messages, user_type, user_name):
+        """
+        Cache key for a conversation. The system prompt is covered by
+        user_type/user_name, since it addresses the user by name.
+        """
+        payload = json.dumps([user_type, user_name, messages[1:]], sort_keys=True)
+        digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return f"voice_assistant:response:{digest}"
+    
+    def _format_completion(self, completion):
+        """Convert a Groq completion into the API response payload"""
+        response_text = completion.choices[0].message.content
+        
+        return {
+            'success': True,
+            'response': response_text,
+            'model': self.COMPLETION_OPTIONS['model'],
+            'tokens_used': completion.usage.total_tokens if completion.usage else None
+        }
+    
+    def _unavailable_response(self):
+        return {
+            'success': False,
+            'response': "I apologize, but I'm currently unavailable. Please try again later or contact support.",
+            'error': 'Groq client not initialized'
+        }
+    
+    def _error_response(self, e):
+        print(f"Error processing voice assistant message: {e}")
+        return {
+            'success': False,
+            'response': "I apologize, but I encountered an issue processing your request. Please try again.",
+            'error': str(e)
+        }
+
 
+# Singleton instance, created on first use so importing this module (e.g. for
+# URL routing in management commands) does not pull in the Groq SDK
+_voice_assistant = None
 
-# Global instance
-voice_assistant = VoiceAssistantService()
+def get_voice_assistant():
+    """Get or create voice assistant service singleton"""
+    global _voice_assistant
+    if _voice_assistant is None:
+        _voice_assistant = VoiceAssistantService()
+    return _voice_assistant
 
 
 @csrf_exempt
@@ -215,12 +287,12 @@ def voice_assistant_api(request):
     - conversation_history: Optional list of previous messages
     """
     try:
-        data = json.loads(request.body)
+        data = _loads(request.body)
         message = data.get('message', '').strip()
         conversation_history = data.get('conversation_history', [])
         
         if not message:
-            return JsonResponse({
+            return _json_response({
                 'success': False,
                 'error': 'No message provided'
             }, status=400)
@@ -234,23 +306,23 @@ def voice_assistant_api(request):
             user_name = request.user.get_full_name() or request.user.username or 'User'
         
         # Process the message
-        result = voice_assistant.process_message(
+        result = get_voice_assistant().process_message(
             message=message,
             user_type=user_type,
             user_name=user_name,
             conversation_history=conversation_history
         )
         
-        return JsonResponse(result)
+        return _json_response(result)
         
-    except json.JSONDecodeError:
-        return JsonResponse({
+    except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
+        return _json_response({
             'success': False,
             'error': 'Invalid JSON in request body'
         }, status=400)
     except Exception as e:
         print(f"Voice assistant API error: {e}")
-        return JsonResponse({
+        return _json_response({
             'success': False,
             'error': 'Internal server error'
         }, status=500)
@@ -261,7 +333,7 @@ def voice_assistant_status(request):
     """
     Check if voice assistant is available
     """
-    return JsonResponse({
-        'available': voice_assistant.client is not None,
-        'model': 'llama-3.3-70b-versatile'
+    return _json_response({
+        'available': get_voice_assistant().client is not None,
+        'model': VoiceAssistantService.COMPLETION_OPTIONS['model']
     })
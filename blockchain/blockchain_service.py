@@ -1,17 +1,289 @@
 """
 Blockchain service for logging and verifying QR code scans
 """
+import asyncio
 import hashlib
 import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from asgiref.sync import sync_to_async
+from eth_abi import decode as abi_decode, encode as abi_encode
+from eth_hash.auto import keccak
 from web3 import Web3
+from web3.utils import event_abi_to_log_topic
+from web3.exceptions import TransactionNotFound, Web3TypeError
 from django.conf import settings
 from django.core.cache import cache
 import logging
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Blockchain settings, read once at import
+RPC_URL = getattr(settings, 'ALCHEMY_RPC_URL', None)
+PRIVATE_KEY = getattr(settings, 'BLOCKCHAIN_PRIVATE_KEY', None)
+CONTRACT_ADDRESS = getattr(settings, 'BLOCKCHAIN_CONTRACT_ADDRESS', None)
+PRESCRIPTION_CONTRACT_ADDRESS = getattr(settings, 'PRESCRIPTION_CONTRACT_ADDRESS', None)
+BROADCAST_RPC_URLS = getattr(settings, 'BLOCKCHAIN_BROADCAST_RPC_URLS', [])
+# Multicall3 is deployed at the same address on Sepolia and most other chains
+MULTICALL3_ADDRESS = getattr(settings, 'MULTICALL3_ADDRESS', '0xcA11bde05977b3631167028862bE2a173976CA11')
+
+BLOCKCHAIN_DIR = Path(__file__).parent
+
+
+def _load_abi(filename):
+    """Load a contract ABI shipped with this module, or None if it is missing"""
+    abi_path = BLOCKCHAIN_DIR / filename
+    if not abi_path.exists():
+        return None
+    abi_bytes = abi_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(abi_bytes)
+    return json.loads(abi_bytes)
+
+
+# Contract ABIs, parsed once per process rather than per service instance
+_MEDICAL_ACCESS_LOGGER_ABI = _load_abi('medical_access_logger_abi.json')
+_PRESCRIPTION_VERIFIER_ABI = _load_abi('contract_abi.json')
+
+
+def _event_topics(*abis):
+    """Map each event name in the given ABIs to its log topic (topics[0])"""
+    topics = {}
+    for abi in abis:
+        for entry in abi or ():
+            if entry.get('type') == 'event':
+                topics[entry['name']] = event_abi_to_log_topic(entry)
+    return topics
+
+
+# Event topics of both contracts, hashed once per process so log lookups
+# never run keccak over signatures
+_EVENT_TOPICS = _event_topics(_MEDICAL_ACCESS_LOGGER_ABI, _PRESCRIPTION_VERIFIER_ABI)
+
+# Topic of the MedicalAccessLogger AccessLogged event (topics[0] of its logs);
+# hashed from the signature if the ABI file is missing
+_ACCESS_LOGGED_TOPIC = _EVENT_TOPICS.setdefault(
+    'AccessLogged',
+    keccak(b"AccessLogged(uint256,bytes32,bytes32,uint256,bool)")
+)
+_ACCESS_LOGGED_DATA_TYPES = ('uint256', 'bool')  # Non-indexed: timestamp, accessGranted
+_ACCESS_LOGGED_TOPIC_HEX = '0x' + _ACCESS_LOGGED_TOPIC.hex()  # As raw JSON-RPC logs spell it
+
+# Selectors and argument types of the two transactions the service sends.
+# Their calldata is ABI-encoded directly rather than through web3's
+# ContractFunction machinery, which re-matches the ABI on every call.
+_LOG_ACCESS_SELECTOR = keccak(b"logAccess(bytes32,bytes32,bool,string)")[:4]
+_LOG_ACCESS_TYPES = ('bytes32', 'bytes32', 'bool', 'string')
+_STORE_PRESCRIPTION_SELECTOR = keccak(b"storePrescription(bytes32,bytes32,bytes32,uint256,string)")[:4]
+_STORE_PRESCRIPTION_TYPES = ('bytes32', 'bytes32', 'bytes32', 'uint256', 'string')
+
+# Read-side encoding for fetching many access logs in one Multicall3 eth_call
+_AGGREGATE3_SELECTOR = keccak(b"aggregate3((address,bool,bytes)[])")[:4]
+_GET_ACCESS_LOG_SELECTOR = keccak(b"getAccessLog(uint256)")[:4]
+_ACCESS_LOG_TYPES = ('bytes32', 'bytes32', 'uint256', 'bytes32', 'bool', 'string')
+
+# Metadata stored with each prescription; the ID is filled in as a JSON string
+_PRESCRIPTION_METADATA_TEMPLATE = '{{"type": "prescription", "prescription_id": {}}}'
+
+# Gas price only moves about once per block, so bursts of transactions can
+# share one lookup for a few seconds
+GAS_PRICE_CACHE_KEY = 'eth_gas_price'
+GAS_PRICE_CACHE_TIMEOUT = 8
+
+# EIP-1559 fees: the pending block's base fee is cached like the gas price,
+# and every transaction offers the same priority fee (tip)
+BASE_FEE_CACHE_KEY = 'eth_base_fee'
+PRIORITY_FEE = Web3.to_wei(1.5, 'gwei')
+
+# Gas used by MedicalAccessLogger.logAccess: the log struct, the two index
+# array pushes and the event, plus one storage word per 32 bytes of metadata
+LOG_ACCESS_BASE_GAS = 260_000
+STORAGE_WORD_GAS = 26_000
+
+# How long the background confirmation thread waits for a receipt (seconds)
+RECEIPT_TIMEOUT = 120
+
+# Receipt polling backs off from the first to the max delay (seconds);
+# wait_for_transaction_receipt would poll every 0.1s
+RECEIPT_POLL_FIRST_DELAY = 0.5
+RECEIPT_POLL_MAX_DELAY = 4
+
+# How long a successful node connectivity probe is trusted (seconds)
+CONNECTION_CHECK_INTERVAL = 30
+
+# Worker threads per process for blockchain calls taken off the request path
+BACKGROUND_WORKERS = 8
+
+# Timeout for a single JSON-RPC HTTP request (seconds)
+RPC_REQUEST_TIMEOUT = 10
+
+# Node errors meaning another sender (e.g. a second gunicorn worker using the
+# same account) already took the nonce; the send is retried once with a
+# resynced nonce
+NONCE_CONFLICT_ERRORS = (
+    'nonce too low',
+    'nonce has already been used',
+    'replacement transaction underpriced',
+)
+
+# Default web3 middleware the service doesn't need: it signs and sends raw
+# transactions itself and never resolves ENS names. The validation
+# middleware alone costs an eth_chainId request before every eth_call and
+# gas estimate. Only attrdict (receipt.status etc.) is kept.
+UNUSED_MIDDLEWARE = ('gas_price_strategy', 'ens_name_to_address', 'validation', 'gas_estimate')
+
+# Receipts per raw JSON-RPC batch request; providers cap the batch size
+RECEIPT_BATCH_SIZE = 50
+
+# Receipt batches sent to the node concurrently
+RECEIPT_BATCH_WORKERS = 8
+
+# Mined receipts (successful or failed) never change, so they are cached
+# for a day rather than fetched again on every sweep
+RECEIPT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _log_access_gas(ipfs_metadata):
+    """Upper bound on the gas used by logAccess for the given metadata string"""
+    metadata_words = (len(ipfs_metadata.encode('utf-8')) + 31) // 32
+    return LOG_ACCESS_BASE_GAS + metadata_words * STORAGE_WORD_GAS
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _keccak_id(identifier):
+    """
+    keccak256 of str(identifier), memoized since the same doctor and patient
+    IDs are hashed over and over (repeat scans, dashboard log lookups)
+    
+    Calls the keccak backend directly (pycryptodome's C implementation)
+    rather than going through Web3.keccak's argument dispatch; the 32-byte
+    digest is identical. The hash is always taken over str(identifier) -
+    existing on-chain logs are looked up by these hashes, so ints must not
+    be hashed as raw bytes. typed=True keeps e.g. 1 and True ("1" vs "True")
+    apart.
+    """
+    if type(identifier) is str:
+        return keccak(identifier.encode('utf-8'))
+    return keccak(str(identifier).encode('utf-8'))
+
+
+@lru_cache(maxsize=256)
+def _checksum_address(address):
+    """EIP-55 checksummed form of an address, memoized per address string"""
+    return Web3.to_checksum_address(address)
+
+
+def _encode_log_access(doctor_hash, patient_hash, access_granted, ipfs_metadata):
+    """Calldata for MedicalAccessLogger.logAccess"""
+    return _LOG_ACCESS_SELECTOR + abi_encode(
+        _LOG_ACCESS_TYPES,
+        (doctor_hash, patient_hash, access_granted, ipfs_metadata)
+    )
+
+
+def _encode_store_prescription(pdf_hash, doctor_hash, patient_hash, prescription_id, metadata):
+    """Calldata for PrescriptionVerifier.storePrescription"""
+    return _STORE_PRESCRIPTION_SELECTOR + abi_encode(
+        _STORE_PRESCRIPTION_TYPES,
+        (pdf_hash, doctor_hash, patient_hash, prescription_id, metadata)
+    )
+
+
+def _prescription_id_to_int(prescription_id):
+    """
+    Convert a prescription ID to the integer stored on-chain
+    
+    UUIDs (uuid.UUID objects and UUID strings) keep their last 64 bits (the
+    last 16 hex digits); anything else is converted with int().
+    """
+    if isinstance(prescription_id, uuid.UUID):
+        return prescription_id.int % (2**64)  # Use last 64 bits
+    if not isinstance(prescription_id, str):
+        return int(prescription_id)
+    
+    # Fast path for plain UUID strings: read the low 8 bytes straight from
+    # the hex instead of building a uuid.UUID
+    try:
+        uuid_bytes = bytes.fromhex(prescription_id.replace('-', ''))
+    except ValueError:
+        uuid_bytes = b''
+    if len(uuid_bytes) == 16:
+        return int.from_bytes(uuid_bytes[8:], 'big')
+    
+    try:
+        # Other UUID spellings ({...}, urn:uuid:...)
+        return uuid.UUID(prescription_id).int % (2**64)  # Use last 64 bits
+    except ValueError:
+        # Not a UUID, try to convert directly
+        return int(prescription_id)
+
+
+def _receipt_log_id(logs):
+    """
+    logId of the AccessLogged event among a web3 receipt's logs, or None
+    
+    The event is found with list.index over the first topics instead of a
+    Python-level loop.
+    """
+    if not logs:
+        return None
+    first_topics = [log['topics'][0] if log['topics'] else None for log in logs]
+    if _ACCESS_LOGGED_TOPIC not in first_topics:
+        return None
+    # The logId is the first indexed parameter (topics[1])
+    return int.from_bytes(logs[first_topics.index(_ACCESS_LOGGED_TOPIC)]['topics'][1], byteorder='big')
+
+
+def _confirmation_from_rpc(tx_hash, receipt):
+    """
+    Confirmation details from a raw eth_getTransactionReceipt result, in the
+    same shape log_qr_scan passes to on_confirmed
+    """
+    log_id = None
+    logs = receipt['logs']
+    if logs:
+        first_topics = [log['topics'][0].lower() if log['topics'] else None for log in logs]
+        if _ACCESS_LOGGED_TOPIC_HEX in first_topics:
+            # The logId is the first indexed parameter (topics[1])
+            log_id = int(logs[first_topics.index(_ACCESS_LOGGED_TOPIC_HEX)]['topics'][1], 16)
+    
+    return {
+        'transaction_hash': tx_hash,
+        'block_number': int(receipt['blockNumber'], 16),
+        'log_id': log_id,
+        'gas_used': int(receipt['gasUsed'], 16),
+        'status': int(receipt['status'], 16),
+    }
+
+
+def _build_rpc_session():
+    """
+    Create a requests session with a keep-alive connection pool for the RPC
+    node, so calls reuse TCP/TLS connections instead of handshaking again
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 class BlockchainService:
     """Service to interact with MedicalAccessLogger and PrescriptionVerifier smart contracts"""
@@ -22,23 +294,42 @@ class BlockchainService:
         self.contract = None
         self.prescription_contract = None
         self.account = None
+        self.chain_id = None
         self.connected = False
+        self._session = None
+        self._connection_checked_at = None
+        
+        # Nonces are handed out locally so each transaction skips the
+        # eth_getTransactionCount round trip (see _send_transaction)
+        self._nonce_lock = threading.Lock()
+        self._next_nonce = None
         
         try:
             # Connect to Ethereum network
-            rpc_url = getattr(settings, 'ALCHEMY_RPC_URL', None)
+            rpc_url = RPC_URL
             if not rpc_url:
                 logger.warning("ALCHEMY_RPC_URL not configured")
                 return
             
-            self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+            # Keep a reference to the pooled session for the service's lifetime
+            self._session = _build_rpc_session()
+            self.w3 = Web3(Web3.HTTPProvider(
+                rpc_url,
+                session=self._session,
+                request_kwargs={'timeout': RPC_REQUEST_TIMEOUT}
+            ))
+            for name in UNUSED_MIDDLEWARE:
+                self.w3.middleware_onion.remove(name)
             
             if not self.w3.is_connected():
                 logger.error("Failed to connect to Ethereum network")
                 return
             
+            # Chain ID never changes for a network, so fetch it once
+            self.chain_id = self.w3.eth.chain_id
+            
             # Load account
-            private_key = getattr(settings, 'BLOCKCHAIN_PRIVATE_KEY', None)
+            private_key = PRIVATE_KEY
             if not private_key:
                 logger.warning("BLOCKCHAIN_PRIVATE_KEY not configured")
                 return
@@ -46,40 +337,33 @@ class BlockchainService:
             self.account = self.w3.eth.account.from_key(private_key)
             
             # Load QR code logging contract (MedicalAccessLogger)
-            contract_address = getattr(settings, 'BLOCKCHAIN_CONTRACT_ADDRESS', None)
+            contract_address = CONTRACT_ADDRESS
             if contract_address:
-                # Try to load ABI for MedicalAccessLogger (if exists)
-                abi_path = Path(__file__).parent / 'medical_access_logger_abi.json'
-                if abi_path.exists():
-                    with open(abi_path, 'r') as f:
-                        abi = json.load(f)
-                    
+                # Use ABI for MedicalAccessLogger (if exists)
+                if _MEDICAL_ACCESS_LOGGER_ABI is not None:
                     self.contract = self.w3.eth.contract(
-                        address=Web3.to_checksum_address(contract_address),
-                        abi=abi
+                        address=_checksum_address(contract_address),
+                        abi=_MEDICAL_ACCESS_LOGGER_ABI
                     )
                     logger.info(f"✓ MedicalAccessLogger contract loaded: {contract_address}")
                 else:
                     logger.warning(f"MedicalAccessLogger ABI not found, QR logging disabled")
             
             # Load prescription verification contract (PrescriptionVerifier)
-            prescription_contract_address = getattr(settings, 'PRESCRIPTION_CONTRACT_ADDRESS', None)
+            prescription_contract_address = PRESCRIPTION_CONTRACT_ADDRESS
             if prescription_contract_address:
-                # Load ABI for PrescriptionVerifier (contract_abi.json is for PrescriptionVerifier)
-                abi_path = Path(__file__).parent / 'contract_abi.json'
-                if abi_path.exists():
-                    with open(abi_path, 'r') as f:
-                        abi = json.load(f)
-                    
+                # Use ABI for PrescriptionVerifier (contract_abi.json is for PrescriptionVerifier)
+                if _PRESCRIPTION_VERIFIER_ABI is not None:
                     self.prescription_contract = self.w3.eth.contract(
-                        address=Web3.to_checksum_address(prescription_contract_address),
-                        abi=abi
+                        address=_checksum_address(prescription_contract_address),
+                        abi=_PRESCRIPTION_VERIFIER_ABI
                     )
                     logger.info(f"✓ PrescriptionVerifier contract loaded: {prescription_contract_address}")
                 else:
-                    logger.error(f"PrescriptionVerifier ABI not found at {abi_path}")
+                    logger.error(f"PrescriptionVerifier ABI not found at {BLOCKCHAIN_DIR / 'contract_abi.json'}")
             
             self.connected = True
+            self._connection_checked_at = time.monotonic()
             logger.info(f"✓ Blockchain service initialized")
             
         except Exception as e:
@@ -87,8 +371,27 @@ class BlockchainService:
             self.connected = False
     
     def is_connected(self):
-        """Check if blockchain service is connected"""
-        return self.connected and self.w3 and self.w3.is_connected()
+        """
+        Check if blockchain service is connected
+        
+        The node is only probed again once the last successful check is older
+        than CONNECTION_CHECK_INTERVAL, or after an RPC call has failed.
+        """
+        if not (self.connected and self.w3):
+            return False
+        
+        checked_at = self._connection_checked_at
+        if checked_at is not None and time.monotonic() - checked_at < CONNECTION_CHECK_INTERVAL:
+            return True
+        
+        if not self.w3.is_connected():
+            return False
+        self._connection_checked_at = time.monotonic()
+        return True
+    
+    def _expire_connection_check(self):
+        """Force the next is_connected() call to probe the node again"""
+        self._connection_checked_at = None
     
     def get_balance(self):
         """Get account ETH balance"""
@@ -101,21 +404,252 @@ class BlockchainService:
             return float(balance_eth)
         except Exception as e:
             logger.error(f"Error getting balance: {str(e)}")
+            self._expire_connection_check()
             return None
     
+    def _gas_price(self):
+        """Current gas price, cached for a few seconds across requests"""
+        gas_price = cache.get(GAS_PRICE_CACHE_KEY)
+        if gas_price is None:
+            gas_price = self.w3.eth.gas_price
+            cache.set(GAS_PRICE_CACHE_KEY, gas_price, GAS_PRICE_CACHE_TIMEOUT)
+        return gas_price
+    
+    def _fee_params(self):
+        """
+        EIP-1559 fee fields for a transaction
+        
+        maxFeePerGas allows the base fee to double (about six full blocks)
+        before the transaction stops being includable; only the actual base
+        fee plus the tip is charged.
+        """
+        base_fee = cache.get(BASE_FEE_CACHE_KEY)
+        if base_fee is None:
+            base_fee = self.w3.eth.get_block('pending')['baseFeePerGas']
+            cache.set(BASE_FEE_CACHE_KEY, base_fee, GAS_PRICE_CACHE_TIMEOUT)
+        return {
+            'maxFeePerGas': base_fee * 2 + PRIORITY_FEE,
+            'maxPriorityFeePerGas': PRIORITY_FEE,
+        }
+    
+    def _send_transaction(self, transaction):
+        """
+        Assign the next account nonce, sign and send a transaction
+        
+        Runs under the nonce lock so concurrent senders in this process reach
+        the node in nonce order. The local nonce can't see other processes
+        sending from the same account, so a nonce conflict resyncs it from
+        the node's pending count and retries the send once.
+        """
+        with self._nonce_lock:
+            for attempt in range(2):
+                if self._next_nonce is None:
+                    self._next_nonce = self.w3.eth.get_transaction_count(
+                        self.account.address, 'pending'
+                    )
+                signed_txn = self.account.sign_transaction({**transaction, 'nonce': self._next_nonce})
+                try:
+                    tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+                except Exception as e:
+                    message = str(e).lower()
+                    if 'already known' in message:
+                        # This exact transaction already reached the node
+                        tx_hash = signed_txn.hash
+                    else:
+                        self._next_nonce = None
+                        if attempt or not any(error in message for error in NONCE_CONFLICT_ERRORS):
+                            raise
+                        logger.warning(f"Nonce conflict ({str(e)}), resyncing nonce and retrying")
+                        continue
+                self._next_nonce += 1
+                break
+        
+        # Hand the same signed transaction to any extra RPC endpoints so it
+        # reaches more of the network sooner
+        for url in BROADCAST_RPC_URLS:
+            submit_background(self._rebroadcast, url, signed_txn.raw_transaction)
+        
+        return tx_hash
+    
+    def _rebroadcast(self, url, raw_transaction):
+        """Send an already submitted transaction to another RPC endpoint"""
+        payload = {
+            'jsonrpc': '2.0',
+            'id': 1,
+            'method': 'eth_sendRawTransaction',
+            'params': [Web3.to_hex(raw_transaction)],
+        }
+        try:
+            # "already known" errors are expected and harmless here
+            self._session.post(url, json=payload, timeout=RPC_REQUEST_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Rebroadcast to {url} failed: {str(e)}")
+    
+    def _fetch_transaction_params(self, call):
+        """
+        Fetch gas price and gas estimate for a contract call in one JSON-RPC
+        batch request. The gas price is only requested when it is not
+        already cached.
+        
+        Args:
+            call: dict with the contract address ('to') and calldata ('data')
+        
+        Returns:
+            tuple of (gas_price, gas_estimate)
+        """
+        call = {'from': self.account.address, **call}
+        gas_price = cache.get(GAS_PRICE_CACHE_KEY)
+        try:
+            with self.w3.batch_requests() as batch:
+                batch.add(self.w3.eth.estimate_gas(call))
+                if gas_price is None:
+                    batch.add(self.w3.eth.gas_price)
+                results = batch.execute()
+        except Web3TypeError:
+            # Provider does not support batching - fall back to sequential calls
+            return self._gas_price(), self.w3.eth.estimate_gas(call)
+        
+        gas_estimate = results[0]
+        if gas_price is None:
+            gas_price = results[1]
+            cache.set(GAS_PRICE_CACHE_KEY, gas_price, GAS_PRICE_CACHE_TIMEOUT)
+        return gas_price, gas_estimate
+    
+    def _poll_receipt(self, tx_hash_hex):
+        """
+        Poll for a transaction receipt with exponential backoff
+        
+        Returns:
+            The receipt, or None if it didn't arrive within RECEIPT_TIMEOUT
+        """
+        deadline = time.monotonic() + RECEIPT_TIMEOUT
+        delay = RECEIPT_POLL_FIRST_DELAY
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            try:
+                return self.w3.eth.get_transaction_receipt(tx_hash_hex)
+            except TransactionNotFound:
+                delay = min(delay * 2, RECEIPT_POLL_MAX_DELAY)
+        return None
+    
+    def get_confirmations(self, tx_hashes):
+        """
+        Look up many transactions' receipts with raw JSON-RPC batch requests,
+        RECEIPT_BATCH_SIZE receipts per HTTP round trip and up to
+        RECEIPT_BATCH_WORKERS requests in flight at once
+        
+        web3's batch_requests can't be used here: a receipt that doesn't
+        exist yet fails the whole batch, and most receipts being looked up
+        are for transactions that may still be pending.
+        
+        Args:
+            tx_hashes: Iterable of 0x-prefixed transaction hashes
+            
+        Returns:
+            dict mapping each hash to a dict with block_number, log_id,
+            gas_used and status, or None if it isn't mined yet (or the
+            lookup failed)
+        """
+        tx_hashes = list(tx_hashes)
+        confirmations = dict.fromkeys(tx_hashes)
+        
+        # Receipts seen by an earlier lookup come from the cache
+        cached = cache.get_many([f'receipt:{tx_hash}' for tx_hash in tx_hashes])
+        for tx_hash in tx_hashes:
+            confirmations[tx_hash] = cached.get(f'receipt:{tx_hash}')
+        tx_hashes = [tx_hash for tx_hash in tx_hashes if confirmations[tx_hash] is None]
+        
+        if not tx_hashes or not self.is_connected():
+            return confirmations
+        
+        chunks = [
+            tx_hashes[start:start + RECEIPT_BATCH_SIZE]
+            for start in range(0, len(tx_hashes), RECEIPT_BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            confirmations.update(self._fetch_confirmation_batch(chunks[0]))
+        else:
+            # Keep several batches in flight on the pooled session
+            with ThreadPoolExecutor(max_workers=min(len(chunks), RECEIPT_BATCH_WORKERS)) as executor:
+                for batch_confirmations in executor.map(self._fetch_confirmation_batch, chunks):
+                    confirmations.update(batch_confirmations)
+        
+        cache.set_many(
+            {
+                f'receipt:{tx_hash}': confirmations[tx_hash]
+                for tx_hash in tx_hashes
+                if confirmations[tx_hash] is not None
+            },
+            RECEIPT_CACHE_TIMEOUT
+        )
+        return confirmations
+    
+    def _fetch_confirmation_batch(self, tx_hashes):
+        """Receipts for up to RECEIPT_BATCH_SIZE hashes in one JSON-RPC batch request"""
+        payload = [
+            {'jsonrpc': '2.0', 'id': i, 'method': 'eth_getTransactionReceipt', 'params': [tx_hash]}
+            for i, tx_hash in enumerate(tx_hashes)
+        ]
+        confirmations = {}
+        try:
+            response = self._session.post(RPC_URL, json=payload, timeout=RPC_REQUEST_TIMEOUT)
+            response.raise_for_status()
+            for item in response.json():
+                receipt = item.get('result')
+                if receipt:
+                    tx_hash = tx_hashes[item['id']]
+                    confirmations[tx_hash] = _confirmation_from_rpc(tx_hash, receipt)
+        except Exception as e:
+            logger.error(f"Error fetching transaction receipts: {str(e)}")
+            self._expire_connection_check()
+        return confirmations
+    
+    def _confirm_in_background(self, tx_hash_hex, on_receipt):
+        """
+        Wait for a transaction receipt on a daemon thread and pass it to
+        on_receipt, so callers return as soon as the transaction is sent
+        """
+        def wait_for_receipt():
+            try:
+                tx_receipt = self._poll_receipt(tx_hash_hex)
+                if tx_receipt is None:
+                    logger.warning(f"Transaction {tx_hash_hex} not confirmed after {RECEIPT_TIMEOUT}s")
+                    return
+                on_receipt(tx_receipt)
+            except Exception as e:
+                logger.warning(f"Transaction {tx_hash_hex} not confirmed: {str(e)}")
+        
+        thread = threading.Thread(target=wait_for_receipt)
+        thread.daemon = True
+        thread.start()
+    
+    def event_sig(self, name):
+        """
+        Log topic (keccak of the canonical signature) of a contract event
+        
+        Raises:
+            KeyError: if neither contract ABI defines the event
+        """
+        return _EVENT_TOPICS[name]
+    
     def _hash_identifier(self, identifier):
         """Create a hash of an identifier for privacy"""
-        return self.w3.keccak(text=str(identifier))
+        return _keccak_id(identifier)
     
-    def log_qr_scan(self, doctor_id, patient_id, access_granted=True, metadata=None):
+    def log_qr_scan(self, doctor_id, patient_id, access_granted=True, metadata=None, on_confirmed=None):
         """
         Log a QR code scan to the blockchain
         
+        The transaction is confirmed in the background; the returned result
+        is always pending.
+        
         Args:
             doctor_id: Doctor's user ID
             patient_id: Patient's user ID  
             access_granted: Whether access was granted
             metadata: Optional metadata dict
+            on_confirmed: Optional callable receiving a dict with
+                block_number, log_id, gas_used and status once mined
             
         Returns:
             dict with transaction details or None if failed
@@ -132,42 +666,26 @@ class BlockchainService:
             # Convert metadata to JSON string
             ipfs_metadata = json.dumps(metadata) if metadata else ""
             
-            # Build transaction
-            nonce = self.w3.eth.get_transaction_count(self.account.address)
-            
-            # Estimate gas
-            gas_estimate = self.contract.functions.logAccess(
-                doctor_hash,
-                patient_hash,
-                access_granted,
-                ipfs_metadata
-            ).estimate_gas({'from': self.account.address})
+            # logAccess can't revert, so its gas is computed from the storage
+            # it writes instead of asking the node for an estimate
+            gas_estimate = _log_access_gas(ipfs_metadata)
             
             # Build transaction
-            transaction = self.contract.functions.logAccess(
-                doctor_hash,
-                patient_hash,
-                access_granted,
-                ipfs_metadata
-            ).build_transaction({
-                'chainId': self.w3.eth.chain_id,
+            transaction = {
+                'chainId': self.chain_id,
                 'from': self.account.address,
-                'nonce': nonce,
+                'to': self.contract.address,
+                'data': _encode_log_access(doctor_hash, patient_hash, access_granted, ipfs_metadata),
+                'value': 0,
                 'gas': int(gas_estimate * 1.2),  # Add 20% buffer
-                'gasPrice': self.w3.eth.gas_price,
-            })
-            
-            # Sign transaction
-            signed_txn = self.w3.eth.account.sign_transaction(
-                transaction, 
-                private_key=self.account.key
-            )
+                **self._fee_params(),
+            }
             
-            # Send transaction
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            # Sign and send transaction
+            tx_hash = self._send_transaction(transaction)
             
-            # Ensure tx_hash has 0x prefix for Etherscan
-            tx_hash_hex = tx_hash.hex() if tx_hash.hex().startswith('0x') else f"0x{tx_hash.hex()}"
+            # to_hex always includes the 0x prefix Etherscan expects
+            tx_hash_hex = Web3.to_hex(tx_hash)
             logger.info(f"✓ QR scan transaction sent - TX: {tx_hash_hex}")
             
             # Return immediately with tx hash (don't wait for confirmation)
@@ -178,41 +696,28 @@ class BlockchainService:
                 'explorer_url': f"https://sepolia.etherscan.io/tx/{tx_hash_hex}"
             }
             
-            # Try to get receipt (with short timeout for quick response)
-            try:
-                tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=5)
-                
+            def record_confirmation(tx_receipt):
                 # Parse logs to get logId
-                log_id = None
-                if tx_receipt.logs:
-                    # Decode the AccessLogged event
-                    event_signature = self.w3.keccak(text="AccessLogged(uint256,bytes32,bytes32,uint256,bool)")
-                    for log in tx_receipt.logs:
-                        if log.topics[0] == event_signature:
-                            # The logId is the first indexed parameter (topics[1])
-                            log_id = int.from_bytes(log.topics[1], byteorder='big')
-                            break
+                log_id = _receipt_log_id(tx_receipt.logs)
                 
-                # Update result with confirmed data
-                result.update({
-                    'pending': False,
-                    'block_number': tx_receipt.blockNumber,
-                    'log_id': log_id,
-                    'gas_used': tx_receipt.gasUsed,
-                    'confirmed': True
-                })
                 logger.info(f"✓ Transaction confirmed in block {tx_receipt.blockNumber}")
-                
-            except Exception as e:
-                # Transaction sent but not yet confirmed - that's OK!
-                logger.info(f"Transaction pending confirmation: {tx_hash_hex}")
-                logger.warning(f"Transaction sent but receipt timeout: {str(e)}")
+                if on_confirmed is not None:
+                    on_confirmed({
+                        'transaction_hash': tx_hash_hex,
+                        'block_number': tx_receipt.blockNumber,
+                        'log_id': log_id,
+                        'gas_used': tx_receipt.gasUsed,
+                        'status': tx_receipt.status,
+                    })
+            
+            # Wait for the receipt off the request path
+            self._confirm_in_background(tx_hash_hex, record_confirmation)
             
-            # Return result (either confirmed or pending)
             return result
             
         except Exception as e:
             logger.error(f"Error logging to blockchain: {str(e)}")
+            self._expire_connection_check()
             return {
                 'success': False,
                 'error': str(e)
@@ -248,8 +753,43 @@ class BlockchainService:
             
         except Exception as e:
             logger.error(f"Error verifying access: {str(e)}")
+            self._expire_connection_check()
             return False
     
+    def verify_access_bulk(self, log_ids, doctor_id, patient_id):
+        """
+        Verify several access logs for one doctor/patient pair at once
+        
+        A log is valid when it recorded this doctor and patient, which is
+        what verifyAccess checks. Instead of one eth_call per log, a single
+        eth_getLogs fetches every AccessLogged event for the pair (both
+        hashes are indexed) and the IDs are matched locally.
+        
+        Args:
+            log_ids: Iterable of blockchain log IDs
+            doctor_id: Doctor's user ID
+            patient_id: Patient's user ID
+            
+        Returns:
+            dict mapping log ID to bool (as verify_access)
+        """
+        log_ids = list(log_ids)
+        if not log_ids or not self.is_connected():
+            return {log_id: False for log_id in log_ids}
+        
+        try:
+            logs = self._get_access_logged(
+                doctor_hash=self._hash_identifier(doctor_id),
+                patient_hash=self._hash_identifier(patient_id)
+            )
+        except Exception as e:
+            # e.g. the provider caps eth_getLogs results - verify one by one
+            logger.warning(f"Access event lookup failed, verifying individually: {str(e)}")
+            return {log_id: self.verify_access(log_id, doctor_id, patient_id) for log_id in log_ids}
+        
+        valid_ids = {int.from_bytes(log['topics'][1], byteorder='big') for log in logs}
+        return {log_id: log_id in valid_ids for log_id in log_ids}
+    
     def get_patient_scans(self, patient_id):
         """
         Get all blockchain log IDs for a patient
@@ -269,6 +809,7 @@ class BlockchainService:
             return log_ids
         except Exception as e:
             logger.error(f"Error getting patient scans: {str(e)}")
+            self._expire_connection_check()
             return []
     
     def get_doctor_scans(self, doctor_id):
@@ -290,6 +831,7 @@ class BlockchainService:
             return log_ids
         except Exception as e:
             logger.error(f"Error getting doctor scans: {str(e)}")
+            self._expire_connection_check()
             return []
     
     def get_access_log(self, log_id):
@@ -307,19 +849,155 @@ class BlockchainService:
         
         try:
             log_data = self.contract.functions.getAccessLog(log_id).call()
-            
-            return {
-                'doctor_hash': log_data[0].hex(),
-                'patient_hash': log_data[1].hex(),
-                'timestamp': log_data[2],
-                'access_hash': log_data[3].hex(),
-                'access_granted': log_data[4],
-                'metadata': log_data[5]
-            }
+            return self._format_access_log(log_data)
         except Exception as e:
             logger.error(f"Error getting access log: {str(e)}")
+            self._expire_connection_check()
             return None
     
+    def batch_get_logs(self, log_ids):
+        """
+        Get details for several access logs in one JSON-RPC batch request
+        instead of one round trip per log (e.g. for a dashboard listing)
+        
+        Args:
+            log_ids: Iterable of blockchain log IDs
+            
+        Returns:
+            dict mapping log ID to log details (as get_access_log); logs that
+            couldn't be read map to None
+        """
+        log_ids = list(log_ids)
+        if not log_ids or not self.is_connected():
+            return {log_id: None for log_id in log_ids}
+        
+        try:
+            with self.w3.batch_requests() as batch:
+                for log_id in log_ids:
+                    batch.add(self.contract.functions.getAccessLog(log_id))
+                results = batch.execute()
+        except Web3TypeError:
+            # Provider does not support batching
+            return {log_id: self.get_access_log(log_id) for log_id in log_ids}
+        except Exception as e:
+            # One bad ID fails the whole batch - read them one by one instead
+            logger.warning(f"Batched access log lookup failed, retrying individually: {str(e)}")
+            return {log_id: self.get_access_log(log_id) for log_id in log_ids}
+        
+        return {
+            log_id: self._format_access_log(log_data)
+            for log_id, log_data in zip(log_ids, results)
+        }
+    
+    def get_patient_scan_details(self, patient_id):
+        """
+        Get a patient's access logs with their details in two RPCs:
+        getPatientLogs, then a single Multicall3 eth_call reading every log
+        
+        Args:
+            patient_id: Patient's user ID
+            
+        Returns:
+            dict mapping log ID to log details (as get_access_log); logs that
+            couldn't be read map to None
+        """
+        log_ids = self.get_patient_scans(patient_id)
+        if not log_ids:
+            return {}
+        
+        try:
+            return self._multicall_access_logs(log_ids)
+        except Exception as e:
+            # e.g. no Multicall3 on this chain - fall back to a JSON-RPC batch
+            logger.warning(f"Multicall access log lookup failed, using batch request: {str(e)}")
+            return self.batch_get_logs(log_ids)
+    
+    def _multicall_access_logs(self, log_ids):
+        """Read several access logs through one Multicall3 aggregate3 call"""
+        target = self.contract.address
+        calls = [
+            (target, True, _GET_ACCESS_LOG_SELECTOR + abi_encode(('uint256',), (log_id,)))
+            for log_id in log_ids
+        ]
+        return_data = self.w3.eth.call({
+            'to': MULTICALL3_ADDRESS,
+            'data': _AGGREGATE3_SELECTOR + abi_encode(('(address,bool,bytes)[]',), (calls,)),
+        })
+        (results,) = abi_decode(('(bool,bytes)[]',), return_data)
+        
+        return {
+            log_id: self._format_access_log(abi_decode(_ACCESS_LOG_TYPES, log_data)) if success else None
+            for log_id, (success, log_data) in zip(log_ids, results)
+        }
+    
+    def get_logs_for_patient(self, patient_id, from_block=0, to_block='latest'):
+        """
+        Get a patient's AccessLogged events with a topic-filtered eth_getLogs
+        
+        patientHash is an indexed event parameter, so the node narrows the
+        search with its log bloom filters instead of the contract walking
+        its patientLogs mapping. Metadata isn't part of the event; use
+        get_access_log for it.
+        
+        Args:
+            patient_id: Patient's user ID
+            from_block: First block to search
+            to_block: Last block to search
+            
+        Returns:
+            list of event dicts in chain order
+        """
+        if not self.is_connected():
+            return []
+        
+        try:
+            patient_hash = self._hash_identifier(patient_id)
+            logs = self._get_access_logged(
+                patient_hash=patient_hash,
+                from_block=from_block,
+                to_block=to_block
+            )
+            
+            events = []
+            for log in logs:
+                timestamp, access_granted = abi_decode(_ACCESS_LOGGED_DATA_TYPES, log['data'])
+                events.append({
+                    'log_id': int.from_bytes(log['topics'][1], byteorder='big'),
+                    'doctor_hash': log['topics'][2].hex(),
+                    'patient_hash': log['topics'][3].hex(),
+                    'timestamp': timestamp,
+                    'access_granted': access_granted,
+                    'block_number': log['blockNumber'],
+                    'transaction_hash': Web3.to_hex(log['transactionHash']),
+                })
+            return events
+        except Exception as e:
+            logger.error(f"Error getting patient access events: {str(e)}")
+            self._expire_connection_check()
+            return []
+    
+    def _get_access_logged(self, doctor_hash=None, patient_hash=None, from_block=0, to_block='latest'):
+        """Raw AccessLogged logs, filtered on the indexed doctor and/or patient hash"""
+        return self.w3.eth.get_logs({
+            'address': self.contract.address,
+            # Indexed parameters: logId, doctorHash, patientHash
+            'topics': [self.event_sig('AccessLogged'), None, doctor_hash, patient_hash],
+            'fromBlock': from_block,
+            'toBlock': to_block,
+        })
+    
+    @staticmethod
+    def _format_access_log(log_data):
+        """Convert a getAccessLog() result tuple into a dict"""
+        return {
+            'doctor_hash': log_data[0].hex(),
+            'patient_hash': log_data[1].hex(),
+            'timestamp': log_data[2],
+            'access_hash': log_data[3].hex(),
+            'access_granted': log_data[4],
+            'metadata': log_data[5]
+        }
+    
     def get_total_logs(self):
         """Get total number of logs on blockchain"""
         if not self.is_connected():
@@ -329,8 +1007,36 @@ class BlockchainService:
             return self.contract.functions.getTotalLogs().call()
         except Exception as e:
             logger.error(f"Error getting total logs: {str(e)}")
+            self._expire_connection_check()
             return 0
     
+    def get_balance_and_total_logs(self):
+        """
+        Get the account ETH balance and the total number of logs in one
+        JSON-RPC batch request (e.g. for health checks)
+        
+        Returns:
+            tuple of (balance, total_logs); balance is None if it couldn't
+            be read, total_logs is 0 as in get_total_logs
+        """
+        if not self.is_connected():
+            return None, 0
+        
+        try:
+            with self.w3.batch_requests() as batch:
+                batch.add(self.w3.eth.get_balance(self.account.address))
+                batch.add(self.contract.functions.getTotalLogs())
+                balance_wei, total_logs = batch.execute()
+        except Web3TypeError:
+            # Provider does not support batching
+            return self.get_balance(), self.get_total_logs()
+        except Exception as e:
+            logger.error(f"Error getting balance and total logs: {str(e)}")
+            self._expire_connection_check()
+            return None, 0
+        
+        return float(self.w3.from_wei(balance_wei, 'ether')), total_logs
+    
     def store_prescription_hash(self, prescription_id, pdf_hash, patient_id, doctor_id):
         """
         Store prescription PDF hash on blockchain for verification
@@ -350,24 +1056,11 @@ class BlockchainService:
         
         try:
             # Convert UUID to integer if needed
-            if isinstance(prescription_id, str):
-                # If it's a UUID string, convert to int
-                import uuid as uuid_lib
-                try:
-                    prescription_uuid = uuid_lib.UUID(str(prescription_id))
-                    prescription_id_int = prescription_uuid.int % (2**64)  # Use last 64 bits
-                except ValueError:
-                    # Not a UUID, try to convert directly
-                    prescription_id_int = int(prescription_id)
-            else:
-                prescription_id_int = int(prescription_id)
+            prescription_id_int = _prescription_id_to_int(prescription_id)
             
             # Convert PDF hash from hex string to bytes32
+            # (to_bytes accepts the hex with or without the 0x prefix)
             if isinstance(pdf_hash, str):
-                if pdf_hash.startswith('0x'):
-                    pdf_hash_bytes = bytes.fromhex(pdf_hash[2:])
-                else:
-                    pdf_hash_bytes = bytes.fromhex(pdf_hash)
                 pdf_hash_bytes32 = self.w3.to_bytes(hexstr=pdf_hash)
             else:
                 pdf_hash_bytes32 = pdf_hash
@@ -376,53 +1069,46 @@ class BlockchainService:
             doctor_hash = self._hash_identifier(doctor_id)
             patient_hash = self._hash_identifier(patient_id)
             
-            # Create metadata
-            metadata = json.dumps({
-                'type': 'prescription',
-                'prescription_id': str(prescription_id),  # Convert UUID to string
-            })
+            # Create metadata (same text json.dumps produced for the dict)
+            if isinstance(prescription_id, (uuid.UUID, int)):
+                # UUIDs and ints never contain characters that need escaping
+                prescription_id_json = f'"{prescription_id}"'
+            else:
+                prescription_id_json = json.dumps(str(prescription_id))
+            metadata = _PRESCRIPTION_METADATA_TEMPLATE.format(prescription_id_json)
             
-            # Build transaction
-            nonce = self.w3.eth.get_transaction_count(self.account.address)
+            # Encode the contract call once for both estimation and building
+            store_call = {
+                'to': self.prescription_contract.address,
+                'data': _encode_store_prescription(
+                    pdf_hash_bytes32,
+                    doctor_hash,
+                    patient_hash,
+                    prescription_id_int,
+                    metadata
+                ),
+            }
             
-            # Estimate gas
-            gas_estimate = self.prescription_contract.functions.storePrescription(
-                pdf_hash_bytes32,
-                doctor_hash,
-                patient_hash,
-                prescription_id_int,
-                metadata
-            ).estimate_gas({'from': self.account.address})
+            # Fetch gas price and gas estimate in one batch
+            base_gas_price, gas_estimate = self._fetch_transaction_params(store_call)
             
             # Build transaction with boosted gas for faster confirmation
-            base_gas_price = self.w3.eth.gas_price
             boosted_gas_price = int(base_gas_price * 2)  # 2x gas price for faster confirmation
             
-            transaction = self.prescription_contract.functions.storePrescription(
-                pdf_hash_bytes32,
-                doctor_hash,
-                patient_hash,
-                prescription_id_int,
-                metadata
-            ).build_transaction({
-                'chainId': self.w3.eth.chain_id,
+            transaction = {
+                **store_call,
+                'chainId': self.chain_id,
                 'from': self.account.address,
-                'nonce': nonce,
+                'value': 0,
                 'gas': int(gas_estimate * 1.5),  # Add 50% buffer for safety
                 'gasPrice': boosted_gas_price,  # 2x base price for priority
-            })
-            
-            # Sign transaction
-            signed_txn = self.w3.eth.account.sign_transaction(
-                transaction, 
-                private_key=self.account.key
-            )
+            }
             
-            # Send transaction
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            # Sign and send transaction
+            tx_hash = self._send_transaction(transaction)
             
-            # Ensure tx_hash has 0x prefix for Etherscan
-            tx_hash_hex = tx_hash.hex() if tx_hash.hex().startswith('0x') else f"0x{tx_hash.hex()}"
+            # to_hex always includes the 0x prefix Etherscan expects
+            tx_hash_hex = Web3.to_hex(tx_hash)
             logger.info(f"✓ Prescription {prescription_id} hash storage transaction sent - TX: {tx_hash_hex}")
             
             # Return immediately with tx hash (don't wait for confirmation)
@@ -433,27 +1119,19 @@ class BlockchainService:
                 'explorer_url': f"https://sepolia.etherscan.io/tx/{tx_hash_hex}"
             }
             
-            # Try to get receipt (with short timeout for quick response)
-            try:
-                tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=5)
-                
-                # Update result with confirmed data
-                result.update({
-                    'pending': False,
-                    'block_number': tx_receipt.blockNumber,
-                    'gas_used': tx_receipt.gasUsed,
-                    'confirmed': True
-                })
-                logger.info(f"✓ Prescription transaction confirmed in block {tx_receipt.blockNumber}")
-                
-            except Exception as e:
-                # Transaction sent but not yet confirmed - that's OK!
-                logger.info(f"Prescription transaction pending confirmation: {tx_hash_hex}")
+            # Wait for the receipt off the request path
+            self._confirm_in_background(
+                tx_hash_hex,
+                lambda tx_receipt: logger.info(
+                    f"✓ Prescription transaction confirmed in block {tx_receipt.blockNumber}"
+                )
+            )
             
             return result
             
         except Exception as e:
             logger.error(f"Error storing prescription hash on blockchain: {str(e)}")
+            self._expire_connection_check()
             return {
                 'success': False,
                 'error': str(e)
@@ -475,11 +1153,9 @@ class BlockchainService:
         
         try:
             # Convert PDF hash from hex string to bytes32
+            # (to_bytes accepts the hex with or without the 0x prefix)
             if isinstance(pdf_hash, str):
-                if pdf_hash.startswith('0x'):
-                    pdf_hash_bytes32 = self.w3.to_bytes(hexstr=pdf_hash)
-                else:
-                    pdf_hash_bytes32 = self.w3.to_bytes(hexstr='0x' + pdf_hash)
+                pdf_hash_bytes32 = self.w3.to_bytes(hexstr=pdf_hash)
             else:
                 pdf_hash_bytes32 = pdf_hash
             
@@ -507,21 +1183,133 @@ class BlockchainService:
                 
         except Exception as e:
             logger.error(f"Error verifying prescription hash: {str(e)}")
+            self._expire_connection_check()
             return None
-
+    
+    # Coroutine variants for async views. Each RPC-bound method runs on a
+    # worker thread (thread_sensitive=False) so concurrent scans overlap their
+    # network waits while sharing this instance's HTTP connection pool.
+    
+    async def alog_qr_scan(self, doctor_id, patient_id, access_granted=True, metadata=None, on_confirmed=None):
+        """Async variant of log_qr_scan"""
+        return await sync_to_async(self.log_qr_scan, thread_sensitive=False)(
+            doctor_id, patient_id, access_granted, metadata, on_confirmed
+        )
+    
+    async def averify_access(self, log_id, doctor_id, patient_id):
+        """Async variant of verify_access"""
+        return await sync_to_async(self.verify_access, thread_sensitive=False)(
+            log_id, doctor_id, patient_id
+        )
+    
+    async def averify_access_bulk(self, log_ids, doctor_id, patient_id):
+        """Async variant of verify_access_bulk"""
+        return await sync_to_async(self.verify_access_bulk, thread_sensitive=False)(log_ids, doctor_id, patient_id)
+    
+    async def aget_patient_scans(self, patient_id):
+        """Async variant of get_patient_scans"""
+        return await sync_to_async(self.get_patient_scans, thread_sensitive=False)(patient_id)
+    
+    async def aget_doctor_scans(self, doctor_id):
+        """Async variant of get_doctor_scans"""
+        return await sync_to_async(self.get_doctor_scans, thread_sensitive=False)(doctor_id)
+    
+    async def aget_access_log(self, log_id):
+        """Async variant of get_access_log"""
+        return await sync_to_async(self.get_access_log, thread_sensitive=False)(log_id)
+    
+    async def abatch_get_logs(self, log_ids):
+        """Async variant of batch_get_logs"""
+        return await sync_to_async(self.batch_get_logs, thread_sensitive=False)(log_ids)
+    
+    async def aget_patient_scan_details(self, patient_id):
+        """Async variant of get_patient_scan_details"""
+        return await sync_to_async(self.get_patient_scan_details, thread_sensitive=False)(patient_id)
+    
+    async def aget_logs_for_patient(self, patient_id, from_block=0, to_block='latest'):
+        """Async variant of get_logs_for_patient"""
+        return await sync_to_async(self.get_logs_for_patient, thread_sensitive=False)(patient_id, from_block, to_block)
+    
+    async def aget_total_logs(self):
+        """Async variant of get_total_logs"""
+        return await sync_to_async(self.get_total_logs, thread_sensitive=False)()
+    
+    async def aget_balance(self):
+        """Async variant of get_balance"""
+        return await sync_to_async(self.get_balance, thread_sensitive=False)()
+    
+    async def astore_prescription_hash(self, prescription_id, pdf_hash, patient_id, doctor_id):
+        """Async variant of store_prescription_hash"""
+        return await sync_to_async(self.store_prescription_hash, thread_sensitive=False)(
+            prescription_id, pdf_hash, patient_id, doctor_id
+        )
+    
+    async def averify_prescription_hash(self, pdf_hash):
+        """Async variant of verify_prescription_hash"""
+        return await sync_to_async(self.verify_prescription_hash, thread_sensitive=False)(pdf_hash)
+    
+    async def alog_and_store(self, doctor_id, patient_id, prescription_id, pdf_hash,
+                             access_granted=True, metadata=None):
+        """
+        Log a QR scan and store a prescription hash concurrently
+        
+        Both transactions are sent in parallel instead of one after the other;
+        each takes its own nonce from the local nonce counter.
+        
+        Returns:
+            tuple of (scan result, prescription result)
+        """
+        return await asyncio.gather(
+            self.alog_qr_scan(doctor_id, patient_id, access_granted, metadata),
+            self.astore_prescription_hash(prescription_id, pdf_hash, patient_id, doctor_id),
+        )
 
 # Singleton instance
 _blockchain_service = None
+_blockchain_service_lock = threading.Lock()
 
 def get_blockchain_service():
     """Get or create blockchain service singleton"""
     global _blockchain_service
     if _blockchain_service is None:
-        _blockchain_service = BlockchainService()
+        # Worker threads may race here; a second instance would hand out
+        # nonces from its own counter
+        with _blockchain_service_lock:
+            if _blockchain_service is None:
+                _blockchain_service = BlockchainService()
     return _blockchain_service
 
 
+# Worker pool, created on first use so each (forked) worker process gets its own
+_executor = None
+_executor_lock = threading.Lock()
+
+def submit_background(fn, *args, **kwargs):
+    """
+    Run fn on the per-process blockchain worker pool and return its Future
+    
+    Requests hand their blockchain calls to this pool instead of blocking on
+    them, so concurrent scans overlap their RPC round trips on the shared
+    connection pool rather than queueing behind each other.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=BACKGROUND_WORKERS,
+                    thread_name_prefix='blockchain'
+                )
+    return _executor.submit(fn, *args, **kwargs)
+
+
 def store_prescription_hash(prescription_id, pdf_hash, patient_id, doctor_id):
     """Convenience function to store prescription hash"""
     service = get_blockchain_service()
     return service.store_prescription_hash(prescription_id, pdf_hash, patient_id, doctor_id)
+
+
+async def astore_prescription_hash(prescription_id, pdf_hash, patient_id, doctor_id):
+    """Async convenience function to store prescription hash"""
+    service = get_blockchain_service()
+    return await service.astore_prescription_hash(prescription_id, pdf_hash, patient_id, doctor_id)
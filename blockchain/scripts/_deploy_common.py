@@ -0,0 +1,144 @@
+"""
+Compile and deploy helpers shared by the contract deployment scripts
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+from packaging.version import Version
+from solcx import compile_standard, get_installed_solc_versions, install_solc
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+SOLC_VERSION = '0.8.19'
+COMPILE_CACHE_DIR = Path.home() / '.cache' / 'rural_care'
+
+# Gas limit for contract creation transactions
+DEPLOY_GAS_LIMIT = 2000000
+
+# Receipt polling backs off from the first to the max delay (seconds);
+# wait_for_transaction_receipt would poll every 0.1s against ~12s blocks
+RECEIPT_TIMEOUT = 300
+RECEIPT_POLL_FIRST_DELAY = 2
+RECEIPT_POLL_MAX_DELAY = 5
+
+
+def ensure_solc():
+    """Install the pinned solc release unless solcx already has it"""
+    if Version(SOLC_VERSION) not in get_installed_solc_versions():
+        install_solc(SOLC_VERSION)
+
+
+def compile_contract(contract_path):
+    """
+    Compile a contract and return (abi, bytecode)
+    
+    The contract must be named after its file (MedicalAccessLogger.sol
+    defines MedicalAccessLogger). Output is cached per compiler input, so
+    repeated deploys of an unchanged contract skip solc entirely. The key
+    covers the solc version and settings as well as the source, so changing
+    either recompiles.
+    """
+    contract_path = Path(contract_path)
+    contract_source_code = contract_path.read_text()
+    source_name = contract_path.name
+    
+    compiler_input = {
+        "language": "Solidity",
+        "sources": {source_name: {"content": contract_source_code}},
+        "settings": {
+            "outputSelection": {
+                "*": {
+                    "*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]
+                }
+            }
+        },
+    }
+    
+    cache_key = json.dumps({'solc': SOLC_VERSION, 'input': compiler_input}, sort_keys=True)
+    input_hash = hashlib.sha256(cache_key.encode()).hexdigest()
+    cache_path = COMPILE_CACHE_DIR / f'solc_{input_hash}.json'
+    
+    if cache_path.exists():
+        with open(cache_path, 'r') as f:
+            artifact = json.load(f)
+        print("✓ Using cached compiler output")
+        return artifact['abi'], artifact['bytecode']
+    
+    ensure_solc()
+    
+    compiled_sol = compile_standard(compiler_input, solc_version=SOLC_VERSION)
+    
+    contract_interface = compiled_sol['contracts'][source_name][contract_path.stem]
+    abi = contract_interface['abi']
+    bytecode = contract_interface['evm']['bytecode']['object']
+    
+    COMPILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w') as f:
+        json.dump({'abi': abi, 'bytecode': bytecode}, f)
+    
+    return abi, bytecode
+
+
+def wait_for_receipt(w3, tx_hash, timeout=RECEIPT_TIMEOUT):
+    """
+    Poll for a transaction receipt with exponential backoff
+    
+    Raises:
+        TimeExhausted: if the transaction isn't mined within timeout seconds
+    """
+    deadline = time.monotonic() + timeout
+    delay = RECEIPT_POLL_FIRST_DELAY
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        try:
+            return w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            delay = min(delay * 2, RECEIPT_POLL_MAX_DELAY)
+    raise TimeExhausted(f"Transaction {w3.to_hex(tx_hash)} is not in the chain after {timeout} seconds")
+
+
+def deploy(w3, account, abi, bytecode, *, gas_boost=1.0):
+    """
+    Build, sign and send a contract creation transaction, then wait for it
+    
+    Uses EIP-1559 fees: gas_boost multiplies the network's suggested
+    priority fee (tip), and maxFeePerGas leaves room for the base fee to
+    double while the transaction is pending.
+    
+    Returns:
+        tuple of (tx_hash_hex, tx_receipt)
+    """
+    Contract = w3.eth.contract(abi=abi, bytecode=bytecode)
+    
+    base_fee = w3.eth.get_block('latest')['baseFeePerGas']
+    priority_fee = int(w3.eth.max_priority_fee * gas_boost)
+    
+    print("⏳ Building deployment transaction...")
+    transaction = Contract.constructor().build_transaction({
+        'chainId': w3.eth.chain_id,
+        'from': account.address,
+        'nonce': w3.eth.get_transaction_count(account.address),
+        'gas': DEPLOY_GAS_LIMIT,
+        'maxFeePerGas': base_fee * 2 + priority_fee,
+        'maxPriorityFeePerGas': priority_fee,
+    })
+    
+    print(f"✓ Base fee: {w3.from_wei(base_fee, 'gwei'):.2f} Gwei")
+    print(f"✓ Priority fee: {w3.from_wei(priority_fee, 'gwei'):.2f} Gwei ({gas_boost:g}x)")
+    max_cost = w3.from_wei(transaction['gas'] * transaction['maxFeePerGas'], 'ether')
+    print(f"✓ Maximum deployment cost: {max_cost:.6f} ETH")
+    
+    print("⏳ Signing transaction...")
+    signed_txn = account.sign_transaction(transaction)
+    
+    print("⏳ Sending transaction to network...")
+    tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+    # to_hex always includes the 0x prefix Etherscan expects
+    tx_hash_hex = w3.to_hex(tx_hash)
+    print(f"✓ Transaction sent: {tx_hash_hex}")
+    print(f"  View on Etherscan: https://sepolia.etherscan.io/tx/{tx_hash_hex}")
+    
+    print("⏳ Waiting for confirmation (this may take 15-60 seconds)...")
+    tx_receipt = wait_for_receipt(w3, tx_hash)
+    
+    return tx_hash_hex, tx_receipt
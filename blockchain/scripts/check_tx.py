@@ -15,26 +15,37 @@ print(f"Checking transaction: {tx_hash}")
 print(f"Etherscan: https://sepolia.etherscan.io/tx/{tx_hash}")
 print("\nWaiting for confirmation...")
 
-for i in range(60):  # Check for 5 minutes
+# Check right away, then back off to about one check per block instead of
+# polling on a fixed 5 second timer
+SEPOLIA_BLOCK_TIME = 12  # seconds
+deadline = time.monotonic() + 300  # Check for 5 minutes
+delay = 1
+receipt = None
+
+while True:
     try:
         receipt = w3.eth.get_transaction_receipt(tx_hash)
-        if receipt:
-            print(f"\n✓ Transaction confirmed!")
-            print(f"Status: {'Success' if receipt.status == 1 else 'Failed'}")
-            print(f"Contract Address: {receipt.contractAddress}")
-            print(f"Block Number: {receipt.blockNumber}")
-            print(f"Gas Used: {receipt.gasUsed:,}")
-            
-            if receipt.contractAddress:
-                print(f"\n🎉 Contract deployed at: {receipt.contractAddress}")
-                print(f"\nAdd this to your .env file:")
-                print(f"BLOCKCHAIN_CONTRACT_ADDRESS={receipt.contractAddress}")
-            break
+        break
     except Exception as e:
         pass
     
+    if time.monotonic() + delay > deadline:
+        break
     print(f".", end="", flush=True)
-    time.sleep(5)
+    time.sleep(delay)
+    delay = min(delay * 2, SEPOLIA_BLOCK_TIME)
+
+if receipt:
+    print(f"\n✓ Transaction confirmed!")
+    print(f"Status: {'Success' if receipt.status == 1 else 'Failed'}")
+    print(f"Contract Address: {receipt.contractAddress}")
+    print(f"Block Number: {receipt.blockNumber}")
+    print(f"Gas Used: {receipt.gasUsed:,}")
+    
+    if receipt.contractAddress:
+        print(f"\n🎉 Contract deployed at: {receipt.contractAddress}")
+        print(f"\nAdd this to your .env file:")
+        print(f"BLOCKCHAIN_CONTRACT_ADDRESS={receipt.contractAddress}")
 else:
     print("\n\nTransaction still pending. Check Etherscan for status.")
     print(f"https://sepolia.etherscan.io/tx/{tx_hash}")
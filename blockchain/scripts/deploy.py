@@ -4,11 +4,8 @@ Deployment script for MedicalAccessLogger smart contract
 import json
 import os
 from web3 import Web3
-from solcx import compile_standard, install_solc
 from pathlib import Path
-
-# Install specific Solidity compiler version
-install_solc('0.8.19')
+from _deploy_common import compile_contract, deploy
 
 def deploy_contract():
     """Deploy MedicalAccessLogger contract to Sepolia testnet"""
@@ -43,38 +40,13 @@ def deploy_contract():
         print("  - https://www.alchemy.com/faucets/ethereum-sepolia")
         return None
     
-    # Read the contract source code
-    contract_path = Path(__file__).parent.parent / 'contracts' / 'MedicalAccessLogger.sol'
-    
-    with open(contract_path, 'r') as file:
-        contract_source_code = file.read()
-    
-    print(f"✓ Contract source loaded")
-    
     # Compile the contract
     print("⏳ Compiling contract...")
-    compiled_sol = compile_standard(
-        {
-            "language": "Solidity",
-            "sources": {"MedicalAccessLogger.sol": {"content": contract_source_code}},
-            "settings": {
-                "outputSelection": {
-                    "*": {
-                        "*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]
-                    }
-                }
-            },
-        },
-        solc_version="0.8.19",
-    )
+    contract_path = Path(__file__).parent.parent / 'contracts' / 'MedicalAccessLogger.sol'
+    abi, bytecode = compile_contract(contract_path)
     
     print("✓ Contract compiled successfully")
     
-    # Get bytecode and ABI
-    contract_interface = compiled_sol['contracts']['MedicalAccessLogger.sol']['MedicalAccessLogger']
-    bytecode = contract_interface['evm']['bytecode']['object']
-    abi = contract_interface['abi']
-    
     # Save ABI to file
     abi_path = Path(__file__).parent.parent / 'contract_abi.json'
     with open(abi_path, 'w') as f:
@@ -82,36 +54,9 @@ def deploy_contract():
     
     print(f"✓ ABI saved to {abi_path}")
     
-    # Create contract instance
-    Contract = w3.eth.contract(abi=abi, bytecode=bytecode)
-    
-    # Get nonce
-    nonce = w3.eth.get_transaction_count(deployer_address)
-    
-    # Build transaction
-    print("⏳ Building deployment transaction...")
-    transaction = Contract.constructor().build_transaction({
-        'chainId': w3.eth.chain_id,
-        'from': deployer_address,
-        'nonce': nonce,
-        'gas': 2000000,
-        'gasPrice': w3.eth.gas_price,
-    })
-    
-    # Sign transaction
-    print("⏳ Signing transaction...")
-    signed_txn = w3.eth.account.sign_transaction(transaction, private_key=PRIVATE_KEY)
-    
-    # Send transaction
+    # Build, sign and send the deployment, then wait for it to be mined
     print("⏳ Deploying contract to Sepolia...")
-    tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-    
-    print(f"✓ Transaction sent: {tx_hash.hex()}")
-    print(f"  View on Etherscan: https://sepolia.etherscan.io/tx/{tx_hash.hex()}")
-    
-    # Wait for transaction receipt
-    print("⏳ Waiting for confirmation (this may take 15-30 seconds)...")
-    tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+    tx_hash_hex, tx_receipt = deploy(w3, account, abi, bytecode)
     
     contract_address = tx_receipt.contractAddress
     
@@ -119,7 +64,7 @@ def deploy_contract():
     print("🎉 CONTRACT DEPLOYED SUCCESSFULLY!")
     print("="*70)
     print(f"Contract Address: {contract_address}")
-    print(f"Transaction Hash: {tx_hash.hex()}")
+    print(f"Transaction Hash: {tx_hash_hex}")
     print(f"Block Number: {tx_receipt.blockNumber}")
     print(f"Gas Used: {tx_receipt.gasUsed}")
     print(f"\n📍 View on Etherscan:")
@@ -129,7 +74,7 @@ def deploy_contract():
     # Save deployment info
     deployment_info = {
         'contract_address': contract_address,
-        'transaction_hash': tx_hash.hex(),
+        'transaction_hash': tx_hash_hex,
         'block_number': tx_receipt.blockNumber,
         'deployer_address': deployer_address,
         'network': 'sepolia',
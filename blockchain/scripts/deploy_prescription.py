@@ -6,8 +6,8 @@ import json
 import sys
 from pathlib import Path
 from web3 import Web3
-from solcx import compile_standard, install_solc
 from dotenv import load_dotenv
+from _deploy_common import compile_contract, deploy
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -56,98 +56,25 @@ def deploy_contract():
         print("  - https://www.alchemy.com/faucets/ethereum-sepolia")
         return None
     
-    # Read the contract source code
-    contract_path = Path(__file__).parent.parent / 'contracts' / 'PrescriptionVerifier.sol'
-    
-    with open(contract_path, 'r') as file:
-        contract_source_code = file.read()
-    
-    print(f"✓ Contract source loaded: PrescriptionVerifier.sol")
-    
-    # Install solc if needed
-    try:
-        print("⏳ Ensuring Solidity compiler is installed...")
-        install_solc('0.8.19')
-        print("✓ Solidity compiler ready")
-    except Exception as e:
-        print(f"⚠ Compiler installation info: {e}")
-    
-    # Compile the contract
+    # Compile the contract (solc is only installed if it's missing)
     print("⏳ Compiling contract...")
-    compiled_sol = compile_standard(
-        {
-            "language": "Solidity",
-            "sources": {"PrescriptionVerifier.sol": {"content": contract_source_code}},
-            "settings": {
-                "outputSelection": {
-                    "*": {
-                        "*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]
-                    }
-                }
-            },
-        },
-        solc_version="0.8.19",
-    )
+    contract_path = Path(__file__).parent.parent / 'contracts' / 'PrescriptionVerifier.sol'
+    abi, bytecode = compile_contract(contract_path)
     
     print("✓ Contract compiled successfully")
     
-    # Get bytecode and ABI
-    contract_interface = compiled_sol['contracts']['PrescriptionVerifier.sol']['PrescriptionVerifier']
-    bytecode = contract_interface['evm']['bytecode']['object']
-    abi = contract_interface['abi']
-    
     # Save ABI to file
     abi_path = Path(__file__).parent.parent / 'contract_abi.json'
     with open(abi_path, 'w') as f:
         json.dump(abi, f, indent=2)
     print(f"✓ ABI saved to: {abi_path}")
     
-    # Create contract instance
-    PrescriptionVerifier = w3.eth.contract(abi=abi, bytecode=bytecode)
-    
-    # Get nonce
-    nonce = w3.eth.get_transaction_count(account.address)
-    print(f"✓ Account nonce: {nonce}")
-    
-    # Build deployment transaction with higher gas price
-    print("\n🏗️  Building deployment transaction...")
-    
-    # Get current gas price and increase it by 3x for faster confirmation
-    current_gas_price = w3.eth.gas_price
-    boosted_gas_price = int(current_gas_price * 3)
-    
-    transaction = PrescriptionVerifier.constructor().build_transaction({
-        'chainId': w3.eth.chain_id,
-        'from': account.address,
-        'nonce': nonce,
-        'gas': 2000000,  # 2M gas limit
-        'gasPrice': boosted_gas_price,
-    })
-    
-    print(f"✓ Current network gas: {w3.from_wei(current_gas_price, 'gwei'):.2f} Gwei")
-    print(f"✓ Using gas price: {w3.from_wei(transaction['gasPrice'], 'gwei'):.2f} Gwei (3x boost)")
-    estimated_cost = w3.from_wei(transaction['gas'] * transaction['gasPrice'], 'ether')
-    print(f"✓ Estimated deployment cost: {estimated_cost:.6f} ETH")
-    
-    # Sign transaction
-    print("\n✍️  Signing transaction...")
-    signed_txn = w3.eth.account.sign_transaction(transaction, private_key=private_key)
-    print("✓ Transaction signed")
-    
-    # Send transaction
-    print("\n📤 Sending transaction to network...")
-    tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-    tx_hash_hex = tx_hash.hex()
-    # Ensure 0x prefix
-    if not tx_hash_hex.startswith('0x'):
-        tx_hash_hex = '0x' + tx_hash_hex
-    print(f"✓ Transaction sent: {tx_hash_hex}")
-    print(f"📍 View on Etherscan: https://sepolia.etherscan.io/tx/{tx_hash_hex}")
+    # Build, sign and send the deployment with a 3x priority fee for
+    # faster confirmation
+    print("\n🏗️  Deploying contract...")
     
-    # Wait for receipt
-    print("\n⏳ Waiting for transaction confirmation (this may take 30-60 seconds)...")
     try:
-        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        tx_hash_hex, tx_receipt = deploy(w3, account, abi, bytecode, gas_boost=3)
         
         if tx_receipt.status == 1:
             contract_address = tx_receipt.contractAddress
@@ -196,8 +123,8 @@ def deploy_contract():
             return None
             
     except Exception as e:
-        print(f"\n❌ Error waiting for transaction: {str(e)}")
-        print(f"Transaction may still be pending: https://sepolia.etherscan.io/tx/{tx_hash_hex}")
+        print(f"\n❌ Error deploying contract: {str(e)}")
+        print("If the transaction was sent it may still be pending - check the Etherscan link above")
         return None
 
 
@@ -53,11 +53,17 @@ def test_blockchain_integration():
         print("   Check your ALCHEMY_RPC_URL and internet connection")
         return
     
+    # Balance and log count are fetched together in one batch request
+    balance, total_logs = None, 0
+    if service.account and service.contract:
+        balance, total_logs = service.get_balance_and_total_logs()
+    elif service.account:
+        balance = service.get_balance()
+    
     # Test 3: Account
     print("\n3️⃣  Testing Account...")
     if service.account:
         print(f"   ✓ Account loaded: {service.account.address}")
-        balance = service.get_balance()
         if balance is not None:
             print(f"   ✓ Balance: {balance:.4f} ETH")
             if balance < 0.01:
@@ -72,12 +78,7 @@ def test_blockchain_integration():
     print("\n4️⃣  Testing Smart Contract...")
     if service.contract:
         print(f"   ✓ Contract loaded: {contract_address}")
-        try:
-            total_logs = service.get_total_logs()
-            print(f"   ✓ Total logs on blockchain: {total_logs}")
-        except Exception as e:
-            print(f"   ✗ Error reading contract: {str(e)}")
-            return
+        print(f"   ✓ Total logs on blockchain: {total_logs}")
     else:
         print("   ✗ Contract not loaded")
         return
@@ -4,27 +4,40 @@ Update blockchain transaction status for pending scans
 import logging
 from django.db import transaction
 from authentication.models import QRCodeScanLog
-from blockchain.blockchain_service import BlockchainService
+from blockchain.blockchain_service import get_blockchain_service
 
 logger = logging.getLogger(__name__)
 
+# Pending scans checked (and saved) per round of receipt lookups
+PENDING_CHUNK_SIZE = 500
+
+
+def normalize_tx_hash(tx_hash):
+    """Canonical stored form of a transaction hash: lowercase, 0x-prefixed"""
+    tx_hash = tx_hash.lower()
+    if not tx_hash.startswith('0x'):
+        tx_hash = f'0x{tx_hash}'
+    return tx_hash
+
 
 def update_pending_transactions():
     """
     Check all pending blockchain transactions and update their status
     Returns: dict with update statistics
     """
-    blockchain_service = BlockchainService()
+    blockchain_service = get_blockchain_service()
     
-    if not blockchain_service.connected:
+    if not blockchain_service.is_connected():
         logger.error("Blockchain service not connected")
         return {'success': False, 'error': 'Blockchain service not connected'}
     
-    # Get all scans with tx_hash but no block_number (pending)
+    # Get all scans with tx_hash but no block_number (pending); failed
+    # transactions are final and aren't checked again
     pending_scans = QRCodeScanLog.objects.filter(
         blockchain_tx_hash__isnull=False,
-        blockchain_block_number__isnull=True
-    ).order_by('-scan_timestamp')
+        blockchain_block_number__isnull=True,
+        blockchain_tx_failed=False
+    ).order_by('id').only('id', 'blockchain_tx_hash')
     
     stats = {
         'success': True,
@@ -35,63 +48,88 @@ def update_pending_transactions():
         'updated_scans': []
     }
     
-    logger.info(f"Checking {pending_scans.count()} pending transactions...")
+    # Work through the pending scans a chunk at a time so memory stays flat
+    # however many are pending. Chunks are keyed on id rather than read from
+    # one open cursor, since each chunk's updates are written before the
+    # next is read
+    last_id = None
+    while True:
+        chunk = pending_scans if last_id is None else pending_scans.filter(id__gt=last_id)
+        scans = list(chunk[:PENDING_CHUNK_SIZE])
+        if not scans:
+            break
+        last_id = scans[-1].id
+        _update_pending_chunk(blockchain_service, scans, stats)
+    
+    logger.info(f"Update complete: checked {stats['checked']}, {stats['confirmed']} confirmed, {stats['still_pending']} still pending, {stats['failed']} failed")
+    return stats
+
+
+def _update_pending_chunk(blockchain_service, scans, stats):
+    """Check one chunk of pending scans and save their new status into stats"""
+    # Fetch the chunk's receipts in batched JSON-RPC requests instead of one
+    # round trip per scan
+    confirmations = blockchain_service.get_confirmations(scan.blockchain_tx_hash for scan in scans)
     
-    for scan in pending_scans:
+    confirmed_scans = []
+    failed_scans = []
+    updated_scans = []
+    for scan in scans:
+        tx_hash = scan.blockchain_tx_hash
         stats['checked'] += 1
+        confirmation = confirmations[tx_hash]
         
-        try:
-            # Ensure tx_hash has 0x prefix
-            tx_hash = scan.blockchain_tx_hash
-            if not tx_hash.startswith('0x'):
-                tx_hash = f'0x{tx_hash}'
-            
-            # Try to get transaction receipt
-            tx_receipt = blockchain_service.w3.eth.get_transaction_receipt(tx_hash)
-            
-            if tx_receipt:
-                # Transaction is confirmed!
-                if tx_receipt.status == 1:  # Success
-                    # Parse logs to get logId
-                    log_id = None
-                    if tx_receipt.logs:
-                        event_signature = blockchain_service.w3.keccak(text="AccessLogged(uint256,bytes32,bytes32,uint256,bool)")
-                        for log in tx_receipt.logs:
-                            if log.topics[0] == event_signature:
-                                log_id = int.from_bytes(log.topics[1], byteorder='big')
-                                break
-                    
-                    # Update database with confirmed data
-                    with transaction.atomic():
-                        scan.blockchain_block_number = tx_receipt.blockNumber
-                        scan.blockchain_verified = True
-                        if log_id:
-                            scan.blockchain_log_id = log_id
-                        scan.save(update_fields=['blockchain_block_number', 'blockchain_verified', 'blockchain_log_id'])
-                    
-                    stats['confirmed'] += 1
-                    stats['updated_scans'].append({
-                        'scan_id': scan.id,
-                        'tx_hash': tx_hash,
-                        'block_number': tx_receipt.blockNumber,
-                        'log_id': log_id
-                    })
-                    logger.info(f"✓ Updated scan {scan.id} - Confirmed in block {tx_receipt.blockNumber}")
-                else:
-                    # Transaction failed
-                    logger.warning(f"✗ Transaction {tx_hash} failed (status: {tx_receipt.status})")
-                    stats['failed'] += 1
-            else:
-                # Still pending
-                stats['still_pending'] += 1
-                logger.debug(f"Transaction {tx_hash} still pending")
+        if confirmation:
+            # Transaction is confirmed!
+            if confirmation['status'] == 1:  # Success
+                log_id = confirmation['log_id']
+                
+                scan.blockchain_block_number = confirmation['block_number']
+                scan.blockchain_verified = True
+                if log_id:
+                    scan.blockchain_log_id = log_id
+                confirmed_scans.append(scan)
                 
-        except Exception as e:
-            logger.error(f"Error checking transaction {scan.blockchain_tx_hash}: {str(e)}")
+                updated_scans.append({
+                    'scan_id': scan.id,
+                    'tx_hash': tx_hash,
+                    'block_number': confirmation['block_number'],
+                    'log_id': log_id
+                })
+            else:
+                # Transaction failed
+                logger.warning(f"✗ Transaction {tx_hash} failed (status: {confirmation['status']})")
+                scan.blockchain_tx_failed = True
+                failed_scans.append(scan)
+        else:
+            # Still pending
             stats['still_pending'] += 1
+            logger.debug(f"Transaction {tx_hash} still pending")
     
-    logger.info(f"Update complete: {stats['confirmed']} confirmed, {stats['still_pending']} still pending, {stats['failed']} failed")
-    return stats
+    # Write the chunk's confirmed and failed scans back in one transaction
+    try:
+        with transaction.atomic():
+            QRCodeScanLog.objects.bulk_update(
+                confirmed_scans,
+                ['blockchain_block_number', 'blockchain_verified', 'blockchain_log_id'],
+                batch_size=PENDING_CHUNK_SIZE
+            )
+            QRCodeScanLog.objects.bulk_update(
+                failed_scans,
+                ['blockchain_tx_failed'],
+                batch_size=PENDING_CHUNK_SIZE
+            )
+    except Exception as e:
+        # Nothing was saved, so every scan in the chunk is still pending
+        logger.error(f"Error saving confirmed transactions: {str(e)}")
+        stats['still_pending'] += len(confirmed_scans) + len(failed_scans)
+        return
+    
+    stats['confirmed'] += len(confirmed_scans)
+    stats['failed'] += len(failed_scans)
+    stats['updated_scans'].extend(updated_scans)
+    for update in updated_scans:
+        logger.info(f"✓ Updated scan {update['scan_id']} - Confirmed in block {update['block_number']}")
 
 
 def update_single_transaction(tx_hash):
@@ -104,22 +142,17 @@ def update_single_transaction(tx_hash):
     Returns:
         dict with update result
     """
-    blockchain_service = BlockchainService()
+    blockchain_service = get_blockchain_service()
     
-    if not blockchain_service.connected:
+    if not blockchain_service.is_connected():
         return {'success': False, 'error': 'Blockchain service not connected'}
     
-    # Ensure tx_hash has 0x prefix
-    if not tx_hash.startswith('0x'):
-        tx_hash = f'0x{tx_hash}'
+    # Hashes are stored in canonical form, so one lookup is enough
+    tx_hash = normalize_tx_hash(tx_hash)
     
     # Find scan with this tx_hash
     try:
-        # Try with 0x prefix
         scan = QRCodeScanLog.objects.filter(blockchain_tx_hash=tx_hash).first()
-        if not scan:
-            # Try without 0x prefix
-            scan = QRCodeScanLog.objects.filter(blockchain_tx_hash=tx_hash[2:]).first()
         
         if not scan:
             return {'success': False, 'error': 'Transaction not found in database'}
@@ -133,29 +166,30 @@ def update_single_transaction(tx_hash):
                 'message': 'Transaction already confirmed'
             }
         
-        # Try to get transaction receipt
-        tx_receipt = blockchain_service.w3.eth.get_transaction_receipt(tx_hash)
+        if scan.blockchain_tx_failed:
+            return {
+                'success': False,
+                'failed': True,
+                'message': 'Transaction failed'
+            }
+        
+        # Same receipt lookup (and receipt cache) as the pending sweep; a
+        # transaction that isn't mined yet comes back as None
+        confirmation = blockchain_service.get_confirmations([tx_hash])[tx_hash]
         
-        if not tx_receipt:
+        if not confirmation:
             return {
                 'success': True,
                 'pending': True,
                 'message': 'Transaction still pending confirmation'
             }
         
-        if tx_receipt.status == 1:  # Success
-            # Parse logs to get logId
-            log_id = None
-            if tx_receipt.logs:
-                event_signature = blockchain_service.w3.keccak(text="AccessLogged(uint256,bytes32,bytes32,uint256,bool)")
-                for log in tx_receipt.logs:
-                    if log.topics[0] == event_signature:
-                        log_id = int.from_bytes(log.topics[1], byteorder='big')
-                        break
+        if confirmation['status'] == 1:  # Success
+            log_id = confirmation['log_id']
             
             # Update database
             with transaction.atomic():
-                scan.blockchain_block_number = tx_receipt.blockNumber
+                scan.blockchain_block_number = confirmation['block_number']
                 scan.blockchain_verified = True
                 if log_id:
                     scan.blockchain_log_id = log_id
@@ -164,15 +198,18 @@ def update_single_transaction(tx_hash):
             return {
                 'success': True,
                 'confirmed': True,
-                'block_number': tx_receipt.blockNumber,
+                'block_number': confirmation['block_number'],
                 'log_id': log_id,
                 'message': 'Transaction confirmed and updated'
             }
         else:
+            scan.blockchain_tx_failed = True
+            scan.save(update_fields=['blockchain_tx_failed'])
+            
             return {
                 'success': False,
                 'failed': True,
-                'message': f'Transaction failed (status: {tx_receipt.status})'
+                'message': f'Transaction failed (status: {confirmation["status"]})'
             }
             
     except Exception as e:
@@ -0,0 +1,30 @@
+import uuid
+
+from django.test import SimpleTestCase
+
+from .blockchain_service import _prescription_id_to_int
+
+
+class PrescriptionIdToIntTests(SimpleTestCase):
+    """On-chain prescription IDs must stay stable for existing records"""
+
+    PRESCRIPTION_UUID = uuid.UUID('12345678-1234-5678-1234-567812345678')
+
+    def test_uuid_object_keeps_last_64_bits(self):
+        self.assertEqual(_prescription_id_to_int(self.PRESCRIPTION_UUID), 1311768465173141112)
+
+    def test_uuid_string_spellings_match_uuid_object(self):
+        expected = self.PRESCRIPTION_UUID.int % (2**64)
+        for spelling in (
+            str(self.PRESCRIPTION_UUID),
+            self.PRESCRIPTION_UUID.hex,
+            str(self.PRESCRIPTION_UUID).upper(),
+            '{%s}' % self.PRESCRIPTION_UUID,
+            self.PRESCRIPTION_UUID.urn,
+        ):
+            with self.subTest(spelling=spelling):
+                self.assertEqual(_prescription_id_to_int(spelling), expected)
+
+    def test_integer_ids(self):
+        self.assertEqual(_prescription_id_to_int(42), 42)
+        self.assertEqual(_prescription_id_to_int('42'), 42)
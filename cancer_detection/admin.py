@@ -1,4 +1,8 @@
 from django.contrib import admin
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest, Least
+from django.utils import timezone
 from .models import CancerImageAnalysis
 from .evidence_models import (
     EvidenceSource, RecommendationEvidence, EvidenceLink,
@@ -97,14 +101,24 @@ class EvidenceSourceAdmin(admin.ModelAdmin):
     def reindex_embeddings(self, request, queryset):
         from .evidence_retriever import EvidenceRetriever
         retriever = EvidenceRetriever()
-        count = 0
-        for source in queryset:
-            if not source.embedding:
-                text = f"{source.title} {source.abstract or ''} {source.key_findings or ''}"
-                source.embedding = retriever.get_embedding(text)
-                source.save(update_fields=['embedding', 'last_indexed'])
-                count += 1
-        self.message_user(request, f"Reindexed embeddings for {count} sources")
+        
+        sources = [source for source in queryset if not source.embedding]
+        texts = [
+            f"{source.title} {source.abstract or ''} {source.key_findings or ''}"
+            for source in sources
+        ]
+        
+        # Embed everything in batched model calls, then write it back in
+        # one transaction
+        now = timezone.now()
+        for source, embedding in zip(sources, retriever.get_embeddings_batch(texts)):
+            source.embedding = embedding
+            source.last_indexed = now
+        
+        with transaction.atomic():
+            EvidenceSource.objects.bulk_update(sources, ['embedding', 'last_indexed'], batch_size=100)
+        
+        self.message_user(request, f"Reindexed embeddings for {len(sources)} sources")
     reindex_embeddings.short_description = "Reindex embeddings for selected sources"
 
 
@@ -143,11 +157,13 @@ class RecommendationEvidenceAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        # get_patient follows treatment_plan -> patient on every row
+        return super().get_queryset(request).select_related('treatment_plan__patient')
+    
     def get_patient(self, obj):
         return obj.treatment_plan.patient.username
     get_patient.short_description = 'Patient'
-    
-    readonly_fields = ('id', 'created_at', 'updated_at')
 
 
 class EvidenceLinkInline(admin.TabularInline):
@@ -184,6 +200,9 @@ class EvidenceExplanationLogAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
+    
     def get_patient(self, obj):
         return obj.user.username
     get_patient.short_description = 'Patient'
@@ -240,15 +259,18 @@ class RuleBasedReferenceAdmin(admin.ModelAdmin):
     init_default_rules.short_description = "Initialize default rules"
     
     def increase_priority(self, request, queryset):
-        for rule in queryset:
-            rule.priority_level = min(rule.priority_level + 1, 100)
-            rule.save()
-        self.message_user(request, f"Increased priority for {queryset.count()} rules")
+        # update() skips auto_now, so stamp updated_at the way save() would
+        count = queryset.update(
+            priority_level=Least(F('priority_level') + 1, 100),
+            updated_at=timezone.now()
+        )
+        self.message_user(request, f"Increased priority for {count} rules")
     increase_priority.short_description = "Increase priority"
     
     def decrease_priority(self, request, queryset):
-        for rule in queryset:
-            rule.priority_level = max(rule.priority_level - 1, 0)
-            rule.save()
-        self.message_user(request, f"Decreased priority for {queryset.count()} rules")
+        count = queryset.update(
+            priority_level=Greatest(F('priority_level') - 1, 0),
+            updated_at=timezone.now()
+        )
+        self.message_user(request, f"Decreased priority for {count} rules")
     decrease_priority.short_description = "Decrease priority"
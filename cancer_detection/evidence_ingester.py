@@ -5,14 +5,23 @@ Extracts and stores evidence in structured format
 """
 
 import os
+import hashlib
 import json
 import logging
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import requests
-from django.db import transaction
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
 from django.core.files.base import ContentFile
+from django.utils import timezone
 
 try:
     import PyPDF2
@@ -20,17 +29,111 @@ try:
 except ImportError:
     PDF_SUPPORT = False
 
+# pypdfium2 (PDFium bindings) extracts text much faster than PyPDF2's
+# pure-Python parser and is used instead when installed
 try:
-    from xml.etree import ElementTree as ET
+    import pypdfium2 as pdfium
+    PDFIUM_SUPPORT = True
+except ImportError:
+    PDFIUM_SUPPORT = False
+
+# lxml parses large efetch responses much faster; the stdlib parser
+# handles the same documents if it isn't installed
+try:
+    from lxml import etree as ET
+    LXML_SUPPORT = True
     XML_SUPPORT = True
 except ImportError:
-    XML_SUPPORT = False
+    LXML_SUPPORT = False
+    try:
+        from xml.etree import ElementTree as ET
+        XML_SUPPORT = True
+    except ImportError:
+        XML_SUPPORT = False
 
+from utils.keyword_regex import compile_keyword_union
 from .evidence_models import EvidenceSource
 from .evidence_retriever import EvidenceRetriever
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT when ingesting evidence in bulk
+BULK_CREATE_BATCH_SIZE = getattr(settings, 'BULK_CREATE_BATCH_SIZE', 100)
+
+# NCBI allows 3 E-utilities requests per second without an API key, 10 with one
+NCBI_API_KEY = os.getenv('NCBI_API_KEY')
+NCBI_REQUESTS_PER_SECOND = 10 if NCBI_API_KEY else 3
+
+
+class _RequestThrottle:
+    """
+    Spaces out requests so no more than `rate` start per second
+    Shared by every thread in the process, since NCBI limits per client
+    """
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self):
+        """Block until the caller may send its next request"""
+        with self._lock:
+            slot = max(time.monotonic(), self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+_ncbi_throttle = _RequestThrottle(NCBI_REQUESTS_PER_SECOND)
+
+# A PMID's record practically never changes, so fetched study details are
+# cached for 30 days rather than requested again on every ingestion run
+PUBMED_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+# Search results change as PubMed indexes new papers, so they are only
+# reused for an hour
+PUBMED_SEARCH_CACHE_TIMEOUT = 60 * 60
+
+# Study-type terms in an abstract and the evidence strength they indicate,
+# matched case-insensitively in one pass over the abstract. ASCII-only case
+# folding keeps every match's lowercase form a key of the dict (Unicode
+# folding would also match e.g. "RANDOMİZED", which lowercases to a
+# different string)
+STUDY_STRENGTH_TERMS = {
+    'meta-analysis': 'high',
+    'systematic review': 'high',
+    'randomized': 'moderate',
+    'rct': 'moderate',
+    'prospective': 'moderate',
+}
+STUDY_STRENGTH_RE = compile_keyword_union(STUDY_STRENGTH_TERMS, re.IGNORECASE | re.ASCII)
+
+
+def _iter_pubmed_articles(xml_source):
+    """
+    Incrementally parse an efetch response, yielding each <PubmedArticle>
+    
+    Each article is cleared once the caller moves on to the next, so memory
+    stays bounded by one article rather than the whole response.
+    
+    Args:
+        xml_source: File-like object with the efetch XML
+    """
+    if LXML_SUPPORT:
+        for _, article in ET.iterparse(xml_source, tag='PubmedArticle'):
+            yield article
+            article.clear()
+            # Drop the already processed siblings still attached to the root
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+    else:
+        for _, elem in ET.iterparse(xml_source):
+            if elem.tag == 'PubmedArticle':
+                yield elem
+                elem.clear()
+
 
 class PubMedIngester:
     """
@@ -40,22 +143,61 @@ class PubMedIngester:
     
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
     
-    # Cancer-related keywords for searches
+    # PMIDs per efetch request (NCBI recommends batches of up to 200)
+    EFETCH_BATCH_SIZE = 200
+    
+    # Concurrent efetch requests when PMIDs span several batches
+    EFETCH_MAX_WORKERS = 3
+    
+    # Cancer-related keywords for searches (frozensets for O(1) membership tests)
     CANCER_KEYWORDS = {
-        'breast': ['breast cancer', 'HER2+', 'hormone receptor', 'estrogen receptor'],
-        'lung': ['lung cancer', 'EGFR', 'ALK', 'non-small cell'],
-        'colorectal': ['colorectal cancer', 'colon cancer', 'rectal cancer'],
-        'prostate': ['prostate cancer', 'PSA', 'androgen deprivation'],
+        'breast': frozenset({'breast cancer', 'HER2+', 'hormone receptor', 'estrogen receptor'}),
+        'lung': frozenset({'lung cancer', 'EGFR', 'ALK', 'non-small cell'}),
+        'colorectal': frozenset({'colorectal cancer', 'colon cancer', 'rectal cancer'}),
+        'prostate': frozenset({'prostate cancer', 'PSA', 'androgen deprivation'}),
     }
     
     TREATMENT_KEYWORDS = {
-        'chemotherapy': ['chemotherapy', 'cytotoxic', 'FOLFOX', 'carboplatin'],
-        'immunotherapy': ['immunotherapy', 'PD-1', 'PD-L1', 'checkpoint inhibitor'],
-        'targeted_therapy': ['targeted therapy', 'tyrosine kinase', 'monoclonal antibody'],
-        'radiation': ['radiation therapy', 'radiotherapy', 'SBRT'],
-        'surgery': ['surgical resection', 'mastectomy', 'lobectomy'],
+        'chemotherapy': frozenset({'chemotherapy', 'cytotoxic', 'FOLFOX', 'carboplatin'}),
+        'immunotherapy': frozenset({'immunotherapy', 'PD-1', 'PD-L1', 'checkpoint inhibitor'}),
+        'targeted_therapy': frozenset({'targeted therapy', 'tyrosine kinase', 'monoclonal antibody'}),
+        'radiation': frozenset({'radiation therapy', 'radiotherapy', 'SBRT'}),
+        'surgery': frozenset({'surgical resection', 'mastectomy', 'lobectomy'}),
     }
     
+    def __init__(self):
+        # Keep-alive connection pool shared by the esearch/efetch calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def _request(self, method: str, endpoint: str, params: Dict, timeout: int,
+                 stream: bool = False) -> requests.Response:
+        """
+        Send an E-utilities request within NCBI's rate limit
+        
+        Args:
+            method: 'GET' (params in the query string) or 'POST' (form body)
+            endpoint: E-utility name, e.g. 'esearch.fcgi'
+            params: Request parameters
+            timeout: Timeout in seconds
+            stream: Leave the body unread so it can be consumed from response.raw
+            
+        Returns:
+            Response (raises for HTTP errors)
+        """
+        if NCBI_API_KEY:
+            params = {**params, 'api_key': NCBI_API_KEY}
+        
+        _ncbi_throttle.wait()
+        if method == 'POST':
+            response = self.session.post(f"{self.BASE_URL}/{endpoint}", data=params, timeout=timeout, stream=stream)
+        else:
+            response = self.session.get(f"{self.BASE_URL}/{endpoint}", params=params, timeout=timeout, stream=stream)
+        response.raise_for_status()
+        return response
+    
     def search_pubmed(self, query: str, max_results: int = 10, 
                      filters: Optional[Dict] = None) -> List[str]:
         """
@@ -69,6 +211,22 @@ class PubMedIngester:
         Returns:
             List of PubMed IDs (PMIDs)
         """
+        return self.search_pubmed_with_history(query, max_results, filters)[0]
+    
+    def search_pubmed_with_history(self, query: str, max_results: int = 10,
+                                   filters: Optional[Dict] = None) -> Tuple[List[str], Optional[Tuple[str, str]]]:
+        """
+        Search PubMed, keeping the result set on the Entrez history server
+        
+        Args:
+            query: Search query (e.g., "breast cancer HER2+ chemotherapy")
+            max_results: Maximum number of PMIDs to return
+            filters: Additional filters (e.g., {'min_date': '2020/01/01'})
+            
+        Returns:
+            Tuple of (PMIDs, history) where history is the (WebEnv, query_key)
+            pair efetch can page through, or None if the search failed
+        """
         try:
             # Build search query
             search_query = query
@@ -79,29 +237,42 @@ class PubMedIngester:
             # Add study type preferences
             search_query += " AND (randomized OR systematic OR meta-analysis OR clinical trial OR cohort)"
             
+            # Repeated searches (e.g. the same cancer/treatment pair from
+            # several callers) are answered from the cache for a while
+            # (NCBI keeps history for hours, well past the cache timeout)
+            cache_key = 'pubmed_history:' + hashlib.sha256(f"{search_query}|{max_results}".encode()).hexdigest()
+            cached = cache.get(cache_key)
+            if cached is not None:
+                pmids, history = cached
+                return list(pmids), history
+            
             # Search
             params = {
                 'db': 'pubmed',
                 'term': search_query,
                 'rettype': 'uilist',
                 'retmax': max_results,
+                'usehistory': 'y',
                 'tool': 'cancer_treatment_system',
                 'email': 'system@cancerfree.india'
             }
             
-            response = requests.get(f"{self.BASE_URL}/esearch.fcgi", params=params, timeout=10)
-            response.raise_for_status()
+            response = self._request('GET', 'esearch.fcgi', params, timeout=10)
             
             # Parse response
             root = ET.fromstring(response.content)
             pmids = [id_elem.text for id_elem in root.findall('.//Id')]
+            webenv = root.findtext('WebEnv')
+            query_key = root.findtext('QueryKey')
+            history = (webenv, query_key) if webenv and query_key else None
+            cache.set(cache_key, (pmids, history), PUBMED_SEARCH_CACHE_TIMEOUT)
             
             logger.info(f"PubMed search returned {len(pmids)} results for query: {query}")
-            return pmids
+            return pmids, history
             
         except Exception as e:
             logger.error(f"PubMed search failed: {str(e)}")
-            return []
+            return [], None
     
     def fetch_study_details(self, pmid: str) -> Optional[Dict]:
         """
@@ -113,78 +284,162 @@ class PubMedIngester:
         Returns:
             Dictionary with study details or None if fetch failed
         """
+        return self.fetch_study_details_batch([pmid]).get(pmid)
+    
+    def fetch_study_details_batch(self, pmids: List[str],
+                                  batch_size: int = EFETCH_BATCH_SIZE,
+                                  history: Optional[Tuple[str, str]] = None) -> Dict[str, Dict]:
+        """
+        Fetch details for several PubMed studies, batch_size PMIDs per request
+        
+        Args:
+            pmids: PubMed IDs
+            batch_size: Maximum PMIDs sent in one efetch call
+            history: (WebEnv, query_key) of the search that returned exactly
+                these PMIDs, in order. efetch then pages through the stored
+                result set instead of being sent the ID list
+            
+        Returns:
+            Dictionary mapping PMID to study details (PMIDs that could not
+            be fetched are left out)
+        """
+        # Studies fetched by an earlier run come from the cache
+        cached = cache.get_many([f'pubmed:{pmid}' for pmid in pmids])
+        details = {pmid: cached[f'pubmed:{pmid}'] for pmid in pmids if f'pubmed:{pmid}' in cached}
+        if details:
+            # Positions in the stored result set no longer line up
+            history = None
+        pmids = [pmid for pmid in pmids if pmid not in details]
+        
+        starts = range(0, len(pmids), batch_size)
+        batches = [pmids[start:start + batch_size] for start in starts]
+        histories = [history] * len(batches)
+        if len(batches) <= 1:
+            batch_results = map(self._fetch_details_batch, batches, histories, starts)
+        else:
+            # Overlap the requests; the shared throttle keeps them within
+            # NCBI's rate limit
+            with ThreadPoolExecutor(max_workers=self.EFETCH_MAX_WORKERS) as executor:
+                batch_results = list(executor.map(self._fetch_details_batch, batches, histories, starts))
+        
+        fetched = {}
+        for batch_details in batch_results:
+            fetched.update(batch_details)
+        
+        cache.set_many({f'pubmed:{pmid}': study for pmid, study in fetched.items()}, PUBMED_CACHE_TIMEOUT)
+        details.update(fetched)
+        return details
+    
+    def _fetch_details_batch(self, pmids: List[str], history: Optional[Tuple[str, str]] = None,
+                             retstart: int = 0) -> Dict[str, Dict]:
+        """
+        Fetch details for one batch of PMIDs in a single efetch request
+        
+        Args:
+            pmids: PubMed IDs
+            history: (WebEnv, query_key) of the search the PMIDs came from
+            retstart: Position of the first PMID in that search's results
+            
+        Returns:
+            Dictionary mapping PMID to study details (empty if the fetch failed)
+        """
+        details = {}
+        
         try:
             params = {
                 'db': 'pubmed',
-                'id': pmid,
                 'rettype': 'abstract',
                 'retmode': 'xml',
                 'tool': 'cancer_treatment_system',
                 'email': 'system@cancerfree.india'
             }
+            if history:
+                params['WebEnv'], params['query_key'] = history
+                params['retstart'] = retstart
+                params['retmax'] = len(pmids)
+            else:
+                params['id'] = ','.join(pmids)
             
-            response = requests.get(f"{self.BASE_URL}/efetch.fcgi", params=params, timeout=10)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.content)
+            # POST keeps long ID lists out of the URL. The body is parsed as
+            # it arrives rather than buffered into one bytes object first
+            with self._request('POST', 'efetch.fcgi', params, timeout=30, stream=True) as response:
+                response.raw.decode_content = True  # Undo gzip transfer encoding
+                for pubmed_article in _iter_pubmed_articles(response.raw):
+                    study = self._parse_pubmed_article(pubmed_article)
+                    if study:
+                        details[study['pmid']] = study
             
-            # Extract article information
-            article = root.find('.//Article')
-            if article is None:
-                return None
-            
-            # Extract title
-            title_elem = article.find('.//ArticleTitle')
-            title = title_elem.text if title_elem is not None else ''
+        except Exception as e:
+            logger.error(f"Failed to fetch PubMed details for PMIDs {', '.join(pmids)}: {str(e)}")
+        
+        return details
+    
+    @staticmethod
+    def _parse_pubmed_article(pubmed_article) -> Optional[Dict]:
+        """
+        Extract study details from one <PubmedArticle> element
+        
+        Args:
+            pubmed_article: PubmedArticle element of an efetch response
             
-            # Extract authors
-            authors_list = []
-            for author in article.findall('.//Author'):
-                last_name = author.findtext('LastName', '')
-                first_init = author.findtext('Initials', '')
+        Returns:
+            Dictionary with study details or None if the record has no article
+        """
+        pmid = pubmed_article.findtext('MedlineCitation/PMID', '')
+        
+        # Extract article information
+        article = pubmed_article.find('MedlineCitation/Article')
+        if not pmid or article is None:
+            return None
+        
+        # Extract title, authors, year, journal and abstract in one walk over
+        # the article rather than a separate .// search per field; like
+        # find(), only the first occurrence of each single-valued field counts
+        title = year = journal = abstract = None
+        authors_list = []
+        for elem in article.iter():
+            tag = elem.tag
+            if tag == 'Author':
+                last_name = elem.findtext('LastName', '')
+                first_init = elem.findtext('Initials', '')
                 if last_name and first_init:
                     authors_list.append(f"{last_name} {first_init}")
-            authors = ', '.join(authors_list[:3])  # First 3 authors
-            
-            # Extract year
-            pub_date = article.find('.//PubDate')
-            year = pub_date.findtext('Year', '') if pub_date is not None else ''
-            
-            # Extract journal
-            journal = article.findtext('.//Journal/Title', '')
-            
-            # Extract abstract
-            abstract_elem = article.find('.//Abstract')
-            abstract = ''
-            if abstract_elem is not None:
+            elif tag == 'ArticleTitle' and title is None:
+                title = ''.join(elem.itertext())
+            elif tag == 'PubDate' and year is None:
+                year = elem.findtext('Year', '')
+            elif tag == 'Journal' and journal is None:
+                journal = elem.findtext('Title')
+            elif tag == 'Abstract' and abstract is None:
+                # itertext() keeps text inside inline markup (<b>, <i>,
+                # <sup>, ...) that .text stops at
                 abstract_texts = []
-                for abstract_text in abstract_elem.findall('.//AbstractText'):
-                    if abstract_text.text:
-                        abstract_texts.append(abstract_text.text)
+                for abstract_text in elem.iter('AbstractText'):
+                    text = ''.join(abstract_text.itertext()).strip()
+                    if text:
+                        abstract_texts.append(text)
                 abstract = ' '.join(abstract_texts)
-            
-            # Extract DOI
-            doi = ''
-            for article_id in article.findall('.//ArticleId'):
-                if article_id.get('IdType') == 'doi':
-                    doi = article_id.text
-                    break
-            
-            return {
-                'pmid': pmid,
-                'title': title,
-                'authors': authors,
-                'year': int(year) if year.isdigit() else None,
-                'journal': journal,
-                'abstract': abstract,
-                'doi': doi,
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to fetch PubMed details for PMID {pmid}: {str(e)}")
-            return None
+        
+        authors = ', '.join(authors_list[:3])  # First 3 authors
+        
+        # Extract DOI (the article's own IDs live in PubmedData, next to
+        # the reference list whose ArticleIds belong to cited papers)
+        doi = ''
+        for article_id in pubmed_article.iterfind('PubmedData/ArticleIdList/ArticleId'):
+            if article_id.get('IdType') == 'doi':
+                doi = article_id.text
+                break
+        
+        return {
+            'pmid': pmid,
+            'title': title or '',
+            'authors': authors,
+            'year': int(year) if year and year.isdigit() else None,
+            'journal': journal or '',
+            'abstract': abstract or '',
+            'doi': doi,
+        }
     
-    @transaction.atomic
     def ingest_pubmed_study(self, pmid: str, 
                            cancer_types: Optional[List[str]] = None,
                            treatment_types: Optional[List[str]] = None) -> Optional[EvidenceSource]:
@@ -200,44 +455,127 @@ class PubMedIngester:
             Created EvidenceSource object or None if failed
         """
         
-        # Check if already ingested
-        if EvidenceSource.objects.filter(pmid=pmid).exists():
+        studies = self.ingest_pubmed_studies(
+            [pmid],
+            cancer_types=cancer_types,
+            treatment_types=treatment_types
+        )
+        return studies[0] if studies else None
+    
+    def ingest_pubmed_studies(self, pmids: List[str],
+                              cancer_types: Optional[List[str]] = None,
+                              treatment_types: Optional[List[str]] = None,
+                              history: Optional[Tuple[str, str]] = None) -> List[EvidenceSource]:
+        """
+        Ingest several PubMed studies, fetching the new ones in batched requests
+        
+        Args:
+            pmids: PubMed IDs
+            cancer_types: Associated cancer types
+            treatment_types: Associated treatment types
+            history: (WebEnv, query_key) of the search that returned pmids,
+                from search_pubmed_with_history
+            
+        Returns:
+            EvidenceSource objects (existing or created) in the order of pmids;
+            studies that could not be fetched are left out
+        """
+        # Check which are already ingested, in one query
+        evidence_by_pmid = EvidenceSource.objects.in_bulk(pmids, field_name='pmid')
+        for pmid in evidence_by_pmid:
             logger.info(f"PMID {pmid} already in database")
-            return EvidenceSource.objects.get(pmid=pmid)
+        to_fetch = [pmid for pmid in pmids if pmid not in evidence_by_pmid]
+        
+        if len(to_fetch) < len(pmids):
+            # Only part of the search result is new
+            history = None
+        details_by_pmid = self.fetch_study_details_batch(to_fetch, history=history)
+        now = timezone.now()
+        new_evidence = [
+            self._build_study_evidence(details, now, cancer_types, treatment_types)
+            for details in details_by_pmid.values()
+        ]
         
-        # Fetch details
-        details = self.fetch_study_details(pmid)
-        if not details:
-            return None
+        if new_evidence:
+            with transaction.atomic():
+                # PMIDs stored concurrently by another ingestion are skipped
+                EvidenceSource.objects.bulk_create(
+                    new_evidence,
+                    batch_size=BULK_CREATE_BATCH_SIZE,
+                    ignore_conflicts=True
+                )
+            # Reload so skipped rows resolve to what is actually stored
+            evidence_by_pmid.update(EvidenceSource.objects.in_bulk(list(details_by_pmid), field_name='pmid'))
+            logger.info(f"Ingested {len(new_evidence)} PubMed studies")
+        
+        return [evidence_by_pmid[pmid] for pmid in pmids if pmid in evidence_by_pmid]
+    
+    def _build_study_evidence(self, details: Dict, now: datetime,
+                              cancer_types: Optional[List[str]] = None,
+                              treatment_types: Optional[List[str]] = None) -> EvidenceSource:
+        """
+        Build an unsaved EvidenceSource from fetched study details
+        
+        Args:
+            details: Study details from fetch_study_details
+            now: Ingestion time, shared by the whole batch
+            cancer_types: Associated cancer types
+            treatment_types: Associated treatment types
+            
+        Returns:
+            Unsaved EvidenceSource object
+        """
         
         # Determine evidence strength (heuristic based on study type)
         # In production, this would be more sophisticated
-        abstract_lower = (details.get('abstract', '') or '').lower()
-        if any(term in abstract_lower for term in ['meta-analysis', 'systematic review']):
-            strength = 'high'
-        elif any(term in abstract_lower for term in ['randomized', 'rct', 'prospective']):
-            strength = 'moderate'
-        else:
-            strength = 'moderate'
-        
-        # Create evidence source
-        evidence = EvidenceSource.objects.create(
+        abstract = details.get('abstract', '') or ''
+        strength = 'moderate'
+        for match in STUDY_STRENGTH_RE.finditer(abstract):
+            if STUDY_STRENGTH_TERMS[match.group().lower()] == 'high':
+                strength = 'high'
+                break
+        
+        return EvidenceSource(
             title=details['title'],
             source_type='pubmed_study',
             authors=details['authors'],
             publication_year=details['year'],
             journal_or_organization=details['journal'],
-            pmid=pmid,
+            pmid=details['pmid'],
             doi=details.get('doi', ''),
             abstract=details['abstract'],
             evidence_strength=strength,
             cancer_types=cancer_types or [],
             treatment_types=treatment_types or [],
-            last_indexed=datetime.now(),
+            last_indexed=now,
         )
+
+
+def _save_guideline(evidence: EvidenceSource) -> Tuple[EvidenceSource, bool]:
+    """
+    Insert a guideline, or return the stored one with the same title and type
+    
+    The unique (title, source_type) constraint decides, so a guideline
+    inserted concurrently by another worker is returned rather than
+    duplicated, without a separate existence check beforehand.
+    
+    Args:
+        evidence: Unsaved guideline EvidenceSource
         
-        logger.info(f"Ingested PubMed study {pmid}: {evidence.title}")
-        return evidence
+    Returns:
+        Tuple of (EvidenceSource, created)
+    """
+    try:
+        with transaction.atomic():
+            evidence.save(force_insert=True)
+        return evidence, True
+    except IntegrityError:
+        existing = EvidenceSource.objects.get(
+            title=evidence.title,
+            source_type=evidence.source_type,
+            pmid__isnull=True
+        )
+        return existing, False
 
 
 class GuidelineIngester:
@@ -286,7 +624,6 @@ class GuidelineIngester:
         }
     }
     
-    @transaction.atomic
     def ingest_guideline(self, guideline_data: Dict) -> Optional[EvidenceSource]:
         """
         Ingest a clinical guideline
@@ -300,18 +637,58 @@ class GuidelineIngester:
             Created EvidenceSource or None
         """
         
-        # Check if already exists
-        existing = EvidenceSource.objects.filter(
-            title=guideline_data['title'],
-            source_type=guideline_data['source_type']
-        ).first()
+        # Create guideline evidence
+        evidence, created = _save_guideline(self._build_guideline_evidence(guideline_data, timezone.now()))
         
-        if existing:
+        if not created:
             logger.info(f"Guideline '{guideline_data['title']}' already in database")
-            return existing
+            return evidence
         
-        # Create guideline evidence
-        evidence = EvidenceSource.objects.create(
+        logger.info(f"Ingested guideline: {evidence.title}")
+        return evidence
+    
+    def ingest_guidelines(self, guidelines_data: List[Dict]) -> int:
+        """
+        Ingest several clinical guidelines with bulk inserts
+        
+        Guidelines already in the database (same title and source type) are
+        skipped by its unique constraint instead of being looked up first.
+        
+        Args:
+            guidelines_data: Guideline dictionaries as accepted by ingest_guideline
+            
+        Returns:
+            Number of guidelines given (all of them are stored afterwards)
+        """
+        now = timezone.now()
+        new_evidence = [
+            self._build_guideline_evidence(guideline_data, now)
+            for guideline_data in guidelines_data
+        ]
+        
+        with transaction.atomic():
+            EvidenceSource.objects.bulk_create(
+                new_evidence,
+                batch_size=BULK_CREATE_BATCH_SIZE,
+                ignore_conflicts=True
+            )
+        
+        logger.info(f"Ingested {len(new_evidence)} guidelines (existing ones skipped)")
+        return len(new_evidence)
+    
+    @staticmethod
+    def _build_guideline_evidence(guideline_data: Dict, now: datetime) -> EvidenceSource:
+        """
+        Build an unsaved EvidenceSource for a clinical guideline
+        
+        Args:
+            guideline_data: Dictionary with guideline information
+            now: Ingestion time, shared by the whole batch
+            
+        Returns:
+            Unsaved EvidenceSource object
+        """
+        return EvidenceSource(
             title=guideline_data['title'],
             source_type=guideline_data['source_type'],
             journal_or_organization=guideline_data.get('organization', ''),
@@ -321,22 +698,19 @@ class GuidelineIngester:
             guideline_url=guideline_data.get('url', ''),
             guideline_version=guideline_data.get('version', ''),
             evidence_strength='high',  # Guidelines are typically high strength
-            publication_year=datetime.now().year,
-            last_indexed=datetime.now(),
+            publication_year=now.year,
+            last_indexed=now,
         )
-        
-        logger.info(f"Ingested guideline: {evidence.title}")
-        return evidence
     
     def ingest_default_guidelines(self):
         """
         Ingest default NCCN guidelines for common cancers
         """
-        count = 0
+        guidelines_data = []
         
         for cancer, stages in self.NCCN_GUIDELINES.items():
             for stage, data in stages.items():
-                guideline_data = {
+                guidelines_data.append({
                     'title': f"NCCN {cancer.capitalize()} Cancer {stage.replace('_', ' ').title()}",
                     'source_type': 'nccn_guideline',
                     'organization': 'National Comprehensive Cancer Network (NCCN)',
@@ -345,23 +719,39 @@ class GuidelineIngester:
                     'treatments': data['recommendations'],
                     'version': data.get('version', ''),
                     'url': data.get('url', ''),
-                }
-                
-                if self.ingest_guideline(guideline_data):
-                    count += 1
+                })
+        
+        count = self.ingest_guidelines(guidelines_data)
         
         logger.info(f"Ingested {count} default NCCN guidelines")
         return count
 
 
+# Recommendation, treatment and management sections of guideline text,
+# compiled once for every PDF parsed
+KEY_SECTION_PATTERNS = [
+    re.compile(r'(recommendation|treatment|management|approach)[\s\S]{0,500}', re.IGNORECASE),
+    re.compile(r'(primary|adjuvant|neoadjuvant)[\s\S]{0,300}', re.IGNORECASE),
+    re.compile(r'(stage \d+?)[\s\S]{0,200}', re.IGNORECASE),
+]
+
+
+# Organization name fragment -> EvidenceSource.source_type for parsed PDFs
+GUIDELINE_ORG_SOURCE_TYPES = {
+    'nccn': 'nccn_guideline',
+    'esmo': 'esmo_guideline',
+    'asco': 'asco_guideline',
+}
+
+
 class PDFGuidelineParser:
     """
-    Parses clinical guideline PDFs (requires PyPDF2)
+    Parses clinical guideline PDFs (requires pypdfium2 or PyPDF2)
     Extracts key recommendations and clinical evidence
     """
     
     def __init__(self):
-        self.pdf_support = PDF_SUPPORT
+        self.pdf_support = PDFIUM_SUPPORT or PDF_SUPPORT
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
@@ -374,20 +764,40 @@ class PDFGuidelineParser:
             Extracted text
         """
         if not self.pdf_support:
-            logger.error("PyPDF2 not available. Cannot parse PDFs.")
+            logger.error("pypdfium2/PyPDF2 not available. Cannot parse PDFs.")
             return ""
         
         try:
-            text = ""
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-            return text
+            return ''.join(self._iter_page_texts(pdf_path))
         except Exception as e:
             logger.error(f"Failed to extract text from PDF {pdf_path}: {str(e)}")
             return ""
     
+    @staticmethod
+    def _iter_page_texts(pdf_path: str):
+        """
+        Yield the text of each page of a PDF file, in order
+        
+        Args:
+            pdf_path: Path to PDF file
+        """
+        if PDFIUM_SUPPORT:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                for index in range(len(pdf)):
+                    page = pdf[index]
+                    textpage = page.get_textpage()
+                    yield textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        else:
+            with open(pdf_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                for page in pdf_reader.pages:
+                    yield page.extract_text() or ''
+    
     def parse_guideline_pdf(self, pdf_path: str, title: str, 
                           organization: str, cancer_types: List[str]) -> Optional[EvidenceSource]:
         """
@@ -414,17 +824,14 @@ class PDFGuidelineParser:
         
         # Determine source type
         org_lower = organization.lower()
-        if 'nccn' in org_lower:
-            source_type = 'nccn_guideline'
-        elif 'esmo' in org_lower:
-            source_type = 'esmo_guideline'
-        elif 'asco' in org_lower:
-            source_type = 'asco_guideline'
-        else:
-            source_type = 'other'
+        source_type = next(
+            (v for k, v in GUIDELINE_ORG_SOURCE_TYPES.items() if k in org_lower),
+            'other'
+        )
         
         # Create evidence source
-        evidence = EvidenceSource.objects.create(
+        now = timezone.now()
+        evidence = EvidenceSource(
             title=title,
             source_type=source_type,
             journal_or_organization=organization,
@@ -433,10 +840,15 @@ class PDFGuidelineParser:
             key_findings=key_findings,
             abstract=text[:500],  # First 500 chars as abstract
             evidence_strength='high',
-            publication_year=datetime.now().year,
-            last_indexed=datetime.now(),
+            publication_year=now.year,
+            last_indexed=now,
         )
         
+        evidence, created = _save_guideline(evidence)
+        if not created:
+            logger.info(f"Guideline '{title}' already in database")
+            return evidence
+        
         logger.info(f"Ingested PDF guideline: {evidence.title}")
         return evidence
     
@@ -453,23 +865,54 @@ class PDFGuidelineParser:
             Key findings text
         """
         
-        # Look for recommendations, treatment, management sections
-        patterns = [
-            r'(recommendation|treatment|management|approach)[\s\S]{0,500}',
-            r'(primary|adjuvant|neoadjuvant)[\s\S]{0,300}',
-            r'(stage \d+?)[\s\S]{0,200}',
-        ]
-        
         key_findings = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            key_findings.extend(matches[:2])  # Take first 2 matches per pattern
+        for pattern in KEY_SECTION_PATTERNS:
+            # Take first 2 matches per pattern, without scanning the rest of the text
+            matches = islice(pattern.finditer(text), 2)
+            key_findings.extend(match.group(1) for match in matches)
         
         # Combine and truncate
         result = ' '.join(key_findings)[:max_length]
         return result
 
 
+# Background ingestion pool, created on first use so each (forked) worker
+# process gets its own. A single worker queues runs up rather than having
+# them compete for NCBI's rate limit
+_ingestion_executor = None
+_ingestion_executor_lock = threading.Lock()
+
+
+def submit_ingestion(fn, *args, **kwargs):
+    """
+    Run an ingestion call on the per-process background pool and return its Future
+    
+    Lets views hand off long E-utilities work instead of holding a request
+    thread for it.
+    """
+    global _ingestion_executor
+    if _ingestion_executor is None:
+        with _ingestion_executor_lock:
+            if _ingestion_executor is None:
+                _ingestion_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix='evidence-ingestion'
+                )
+    return _ingestion_executor.submit(_run_ingestion, fn, *args, **kwargs)
+
+
+def _run_ingestion(fn, *args, **kwargs):
+    """Run a background ingestion call, logging failures"""
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        logger.error(f"Background evidence ingestion failed: {str(e)}")
+        raise
+    finally:
+        # Worker threads get their own DB connection; don't leak it
+        connection.close()
+
+
 class EvidenceIngestionService:
     """
     High-level service coordinating all evidence ingestion
@@ -511,17 +954,14 @@ class EvidenceIngestionService:
         """
         
         query = f"{cancer_type} cancer {treatment_type}"
-        pmids = self.pubmed_ingester.search_pubmed(query, max_results=max_results)
-        
-        ingested = []
-        for pmid in pmids:
-            evidence = self.pubmed_ingester.ingest_pubmed_study(
-                pmid,
-                cancer_types=[cancer_type],
-                treatment_types=[treatment_type]
-            )
-            if evidence:
-                ingested.append(evidence)
+        pmids, history = self.pubmed_ingester.search_pubmed_with_history(query, max_results=max_results)
+        
+        ingested = self.pubmed_ingester.ingest_pubmed_studies(
+            pmids,
+            cancer_types=[cancer_type],
+            treatment_types=[treatment_type],
+            history=history
+        )
         
         logger.info(f"Ingested {len(ingested)} studies for {cancer_type} + {treatment_type}")
         return {
@@ -538,3 +978,18 @@ class EvidenceIngestionService:
                 for e in ingested
             ]
         }
+    
+    def search_and_ingest_studies_background(self, cancer_type: str, treatment_type: str,
+                                             max_results: int = 5) -> Future:
+        """
+        Queue search_and_ingest_studies on the background ingestion pool
+        
+        Args:
+            cancer_type: Type of cancer
+            treatment_type: Treatment type
+            max_results: Maximum studies to ingest
+            
+        Returns:
+            Future resolving to the ingestion results dictionary
+        """
+        return submit_ingestion(self.search_and_ingest_studies, cancer_type, treatment_type, max_results)
@@ -87,6 +87,15 @@ class EvidenceSource(models.Model):
             models.Index(fields=['source_type']),
             models.Index(fields=['evidence_strength']),
         ]
+        constraints = [
+            # Guidelines and other non-PubMed sources are identified by title
+            # and type (PubMed studies by their PMID, and titles can repeat)
+            models.UniqueConstraint(
+                fields=['title', 'source_type'],
+                condition=models.Q(pmid__isnull=True),
+                name='uniq_evidence_title_source'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.source_type}) - {self.evidence_strength}"
@@ -73,6 +73,36 @@ class EvidenceRetriever:
             logger.error(f"Embedding generation failed: {str(e)}")
             return None
     
+    def get_embeddings_batch(self, texts: List[str], batch_size: int = 32) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for several texts in batched model calls
+        
+        Encoding a list lets the model run whole batches through at once
+        instead of one forward pass per text.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Number of texts per forward pass
+            
+        Returns:
+            List of embedding vectors in the same order as texts (None
+            entries if embedding failed)
+        """
+        if not texts:
+            return []
+        if not self.initialized or not self.model:
+            return [None] * len(texts)
+        
+        try:
+            embeddings = self.model.encode(texts, batch_size=batch_size, convert_to_tensor=False)
+            return [
+                embedding.tolist() if isinstance(embedding, np.ndarray) else embedding
+                for embedding in embeddings
+            ]
+        except Exception as e:
+            logger.error(f"Batch embedding generation failed: {str(e)}")
+            return [None] * len(texts)
+    
     def retrieve_evidence(self, query: str, top_k: int = 5, 
                          cancer_types: Optional[List[str]] = None,
                          evidence_strength_filter: Optional[str] = None,
@@ -478,8 +478,15 @@ def search_and_ingest_studies(request):
         {
             "cancer_type": "string",
             "treatment_type": "string",
-            "max_results": integer (default: 5)
+            "max_results": integer (default: 5),
+            "background": boolean (default: false) - queue the ingestion
+                and return 202 immediately instead of waiting for PubMed
         }
+    
+    Background ingestion is best-effort: it runs in this server process,
+    there is no job to poll, and queued work is lost if the worker restarts.
+    Check the evidence list afterwards, or run without "background" when the
+    result matters.
     """
     
     if not request.user.is_staff:
@@ -491,6 +498,19 @@ def search_and_ingest_studies(request):
     data = request.data
     
     ingestion_service = EvidenceIngestionService()
+    
+    # Only a JSON true opts in; strings like "false" must not
+    if data.get('background') is True:
+        ingestion_service.search_and_ingest_studies_background(
+            cancer_type=data.get('cancer_type', ''),
+            treatment_type=data.get('treatment_type', ''),
+            max_results=data.get('max_results', 5)
+        )
+        return Response({
+            'status': 'queued',
+            'message': 'Ingestion queued on a best-effort basis; it is not tracked and may be lost if the server restarts'
+        }, status=status.HTTP_202_ACCEPTED)
+    
     result = ingestion_service.search_and_ingest_studies(
         cancer_type=data.get('cancer_type', ''),
         treatment_type=data.get('treatment_type', ''),
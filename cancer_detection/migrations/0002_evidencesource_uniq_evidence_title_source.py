@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:51
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def merge_duplicate_guidelines(apps, schema_editor):
+    """
+    Merge non-PubMed sources sharing a title and source type into the
+    earliest one, so the unique constraint can be added. Evidence links and
+    explanation logs pointing at a duplicate are moved to the kept source.
+    """
+    EvidenceSource = apps.get_model('cancer_detection', 'EvidenceSource')
+    EvidenceLink = apps.get_model('cancer_detection', 'EvidenceLink')
+    EvidenceExplanationLog = apps.get_model('cancer_detection', 'EvidenceExplanationLog')
+    SourcesShown = EvidenceExplanationLog.sources_shown.through
+
+    duplicate_groups = (
+        EvidenceSource.objects.filter(pmid__isnull=True)
+        .values('title', 'source_type')
+        .annotate(source_count=Count('id'))
+        .filter(source_count__gt=1)
+    )
+    for group in duplicate_groups:
+        source_ids = list(
+            EvidenceSource.objects.filter(
+                pmid__isnull=True, title=group['title'], source_type=group['source_type']
+            ).order_by('created_at', 'id').values_list('id', flat=True)
+        )
+        keep_id, duplicate_ids = source_ids[0], source_ids[1:]
+
+        # References are moved one duplicate at a time. Ones whose
+        # recommendation or log already points at the kept source would
+        # break its unique pairs, so they are left to go with the duplicate
+        for duplicate_id in duplicate_ids:
+            linked = EvidenceLink.objects.filter(evidence_source_id=keep_id).values('recommendation_evidence_id')
+            EvidenceLink.objects.filter(evidence_source_id=duplicate_id).exclude(
+                recommendation_evidence_id__in=linked
+            ).update(evidence_source_id=keep_id)
+
+            shown = SourcesShown.objects.filter(evidencesource_id=keep_id).values('evidenceexplanationlog_id')
+            SourcesShown.objects.filter(evidencesource_id=duplicate_id).exclude(
+                evidenceexplanationlog_id__in=shown
+            ).update(evidencesource_id=keep_id)
+
+        EvidenceSource.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cancer_detection', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_guidelines, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='evidencesource',
+            constraint=models.UniqueConstraint(condition=models.Q(('pmid__isnull', True)), fields=('title', 'source_type'), name='uniq_evidence_title_source'),
+        ),
+    ]
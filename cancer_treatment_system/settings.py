@@ -206,6 +206,9 @@ BLOCKCHAIN_PRIVATE_KEY = os.getenv('BLOCKCHAIN_PRIVATE_KEY', '')
 BLOCKCHAIN_CONTRACT_ADDRESS = os.getenv('BLOCKCHAIN_CONTRACT_ADDRESS', '')
 PRESCRIPTION_CONTRACT_ADDRESS = os.getenv('PRESCRIPTION_CONTRACT_ADDRESS', '')
 BLOCKCHAIN_ENABLED = os.getenv('BLOCKCHAIN_ENABLED', 'True').lower() == 'true'
+# Optional extra RPC endpoints (comma separated) that sent transactions are
+# rebroadcast to, so they propagate faster than through Alchemy alone
+BLOCKCHAIN_BROADCAST_RPC_URLS = [url.strip() for url in os.getenv('BLOCKCHAIN_BROADCAST_RPC_URLS', '').split(',') if url.strip()]
 
 # Email Configuration (Gmail SMTP)
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
@@ -0,0 +1,45 @@
+import re
+
+
+def keyword_union_pattern(keywords):
+    """
+    Build a regex matching any of the given literal keywords.
+
+    Keywords are merged into a prefix trie so shared prefixes are only tried
+    once (e.g. 'ft3|ft4' becomes 'ft(?:3|4)'), which keeps the regex engine
+    from restarting every alternative at every position in the text.
+    """
+    if not keywords:
+        return '(?!)'  # Never matches
+
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End-of-keyword marker
+
+    def build(node):
+        if '' in node and len(node) == 1:
+            return ''
+
+        alternatives = []
+        optional = False
+        for char in sorted(node):
+            if char == '':
+                optional = True
+                continue
+            alternatives.append(re.escape(char) + build(node[char]))
+
+        if len(alternatives) == 1 and not optional:
+            return alternatives[0]
+
+        group = '(?:' + '|'.join(alternatives) + ')'
+        return group + '?' if optional else group
+
+    return build(trie)
+
+
+def compile_keyword_union(keywords, flags=0):
+    """Compile keyword_union_pattern(keywords) into a regex"""
+    return re.compile(keyword_union_pattern(keywords), flags)